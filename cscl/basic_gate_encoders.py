@@ -53,7 +53,7 @@ def encode_and_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralFact
 
     input_lits = ensure_tuple_or_list(input_lits)
 
-    fwd_clause = list(map(lambda x: -x, input_lits))
+    fwd_clause = [-x for x in input_lits]
     fwd_clause.append(output_lit)
     clause_consumer.consume_clause(fwd_clause)
 
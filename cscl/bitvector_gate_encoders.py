@@ -4,6 +4,7 @@ This module provides constraint encoders for gate-like constraints on bitvectors
 bitwise boolean functions and modulo arithmetic.
 """
 
+import itertools
 import math
 from cscl.interfaces import CNFLiteralFactory, ClauseConsumer
 import cscl.basic_gate_encoders as gates
@@ -12,6 +13,30 @@ from cscl.utils import ensure_tuple_or_list
 # TODO: support Plaisted-Greenbaum encoders
 
 
+def _check_gate_vector_args(lhs_input_lits, rhs_input_lits, output_lits):
+    """
+    Checks the arguments of a vector of binary gates, as passed to encode_gate_vector().
+
+    :return: The tuple (lhs_input_lits, rhs_input_lits, output_lits), with each element being a list or a tuple.
+             If output_lits is None, the returned output_lits is a list containing len(lhs_input_lits) times None.
+    """
+    lhs_input_lits = ensure_tuple_or_list(lhs_input_lits)
+    rhs_input_lits = ensure_tuple_or_list(rhs_input_lits)
+
+    if len(lhs_input_lits) != len(rhs_input_lits):
+        raise ValueError("lhs_input_lits and rhs_input_lits must have the same size")
+
+    if output_lits is None:
+        output_lits = [None] * len(lhs_input_lits)
+    else:
+        output_lits = ensure_tuple_or_list(output_lits)
+
+    if len(lhs_input_lits) != len(output_lits):
+        raise ValueError("If output_lits is not None, it must have the same size as lhs_input_lits")
+
+    return lhs_input_lits, rhs_input_lits, output_lits
+
+
 def encode_gate_vector(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralFactory, basic_gate_encoder_fn,
                        lhs_input_lits, rhs_input_lits, output_lits=None):
     """
@@ -38,20 +63,8 @@ def encode_gate_vector(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralF
              output_lit[i] <-> g(lhs_input_lits[i], rhs_input_lits[i]) for all i in
              range(0, len(lhs_input_lits)).
     """
-    lhs_input_lits = ensure_tuple_or_list(lhs_input_lits)
-    rhs_input_lits = ensure_tuple_or_list(rhs_input_lits)
-
-    if len(lhs_input_lits) != len(rhs_input_lits):
-        raise ValueError("lhs_input_lits and rhs_input_lits must have the same size")
-
-    if output_lits is None:
-        output_lits = [None] * len(lhs_input_lits)
-    else:
-        output_lits = ensure_tuple_or_list(output_lits)
-
-    if len(lhs_input_lits) != len(output_lits):
-        raise ValueError("If output_lits is not None, it must have the same size as lhs_input_lits")
-
+    lhs_input_lits, rhs_input_lits, output_lits = _check_gate_vector_args(lhs_input_lits, rhs_input_lits,
+                                                                          output_lits)
     return [basic_gate_encoder_fn(clause_consumer, lit_factory, (lhs, rhs), output_lit)
             for lhs, rhs, output_lit in zip(lhs_input_lits, rhs_input_lits, output_lits)]
 
@@ -76,9 +89,53 @@ def encode_bv_and_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralF
              output_lit[i] <-> (lhs_input_lits[i] AND rhs_input_lits[i]) for all i in
              range(0, len(lhs_input_lits)).
     """
-    return encode_gate_vector(clause_consumer, lit_factory,
-                              gates.encode_and_gate,
-                              lhs_input_lits, rhs_input_lits, output_lits)
+    lhs_input_lits, rhs_input_lits, output_lits = _check_gate_vector_args(lhs_input_lits, rhs_input_lits,
+                                                                          output_lits)
+
+    # This is equivalent to encode_gate_vector(..., gates.encode_and_gate, ...), but the binary AND gates
+    # are encoded directly since this gate is used heavily e.g. for computing partial products
+    # in multipliers:
+    consume_clause = clause_consumer.consume_clause
+    result = []
+    for lhs, rhs, output_lit in zip(lhs_input_lits, rhs_input_lits, output_lits):
+        if output_lit is None:
+            output_lit = lit_factory.create_literal()
+        consume_clause([-lhs, -rhs, output_lit])
+        consume_clause((lhs, -output_lit))
+        consume_clause((rhs, -output_lit))
+        result.append(output_lit)
+    return result
+
+
+def _encode_bv_and_scalar_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralFactory,
+                               input_lits, scalar_lit, output_lits=None):
+    """
+    Encodes the gates output_lits[i] <-> (input_lits[i] AND scalar_lit), i.e. a bitvector AND gate whose
+    right-hand-side input consists of copies of the same literal, without materializing that input.
+
+    No argument checks are performed. If output_lits is not None, only the first len(output_lits)
+    elements of input_lits are used.
+
+    :param clause_consumer: The clause consumer to which the clauses of the gate encoding shall be added.
+    :param lit_factory: The CNF literal factory to be used for creating literals with new variables.
+    :param input_lits: The list or tuple of input literals.
+    :param scalar_lit: The literal AND-ed with each input literal.
+    :param output_lits: The list or tuple of output literals, each either being a literal or None, or None.
+                        If output_lits is None, len(input_lits) output literals with new variables are created.
+    :return: The sequence of gate output literals.
+    """
+    if output_lits is None:
+        output_lits = lit_factory.create_literals(len(input_lits))
+    elif None in output_lits:
+        output_lits = [lit_factory.create_literal() if l is None else l for l in output_lits]
+
+    consume_clause = clause_consumer.consume_clause
+    neg_scalar_lit = -scalar_lit
+    for lit, output_lit in zip(input_lits, output_lits):
+        consume_clause([-lit, neg_scalar_lit, output_lit])
+        consume_clause((lit, -output_lit))
+        consume_clause((scalar_lit, -output_lit))
+    return output_lits
 
 
 def encode_bv_or_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralFactory,
@@ -170,34 +227,43 @@ def encode_bv_ripple_carry_adder_gate(clause_consumer: ClauseConsumer, lit_facto
         return tuple()
 
     if output_lits is None:
-        output_lits = [lit_factory.create_literal() for _ in range(0, width)]
-
-    output_lits = tuple(o if o is not None else lit_factory.create_literal() for o in output_lits)
+        output_lits = lit_factory.create_literals(width)
+    elif None in output_lits:
+        output_lits = tuple(o if o is not None else lit_factory.create_literal() for o in output_lits)
 
     # Carries: carries[i] is the carry-out of full-adder no. i for i in range(0,width)
-    # If carries[i] is None, the carry output is irrelevant and does not need to be encoded
-    carries = [lit_factory.create_literal() for _ in range(0, width-1)]
-    carries.append(carry_out_lit)
+    # If carries[i] is None, the carry output is irrelevant and does not need to be encoded. This can only
+    # be the case for the last carry.
+    carries = lit_factory.create_literals(width-1) + [carry_out_lit]
+
+    encode_sum_gate = gates.encode_full_adder_sum_gate
+    encode_carry_gate = gates.encode_full_adder_carry_gate
 
     # Encode the first adder. If there is a carry_in_lit, use a full adder, otherwise, use
     # a half adder:
     if carry_in_lit is not None:
         adder_input = (lhs_input_lits[0], rhs_input_lits[0], carry_in_lit)
-        gates.encode_full_adder_sum_gate(clause_consumer, lit_factory, adder_input, output_lits[0])
-        if carries[0] is not None:
-            gates.encode_full_adder_carry_gate(clause_consumer, lit_factory, adder_input, carries[0])
+        encode_first_sum_gate, encode_first_carry_gate = encode_sum_gate, encode_carry_gate
     else:
         adder_input = (lhs_input_lits[0], rhs_input_lits[0])
-        gates.encode_binary_xor_gate(clause_consumer, lit_factory, adder_input, output_lits[0])
-        if carries[0] is not None:
-            gates.encode_and_gate(clause_consumer, lit_factory, adder_input, carries[0])
+        encode_first_sum_gate, encode_first_carry_gate = gates.encode_binary_xor_gate, gates.encode_and_gate
 
-    # Encode the rest of the adder:
-    for i in range(1, width):
+    encode_first_sum_gate(clause_consumer, lit_factory, adder_input, output_lits[0])
+    if carries[0] is not None:
+        encode_first_carry_gate(clause_consumer, lit_factory, adder_input, carries[0])
+
+    # Encode the inner adders, which always have a carry output:
+    for i in range(1, width-1):
         adder_input = (lhs_input_lits[i], rhs_input_lits[i], carries[i-1])
-        gates.encode_full_adder_sum_gate(clause_consumer, lit_factory, adder_input, output_lits[i])
-        if carries[i] is not None:
-            gates.encode_full_adder_carry_gate(clause_consumer, lit_factory, adder_input, carries[i])
+        encode_sum_gate(clause_consumer, lit_factory, adder_input, output_lits[i])
+        encode_carry_gate(clause_consumer, lit_factory, adder_input, carries[i])
+
+    # Encode the last adder:
+    if width > 1:
+        adder_input = (lhs_input_lits[width-1], rhs_input_lits[width-1], carries[width-2])
+        encode_sum_gate(clause_consumer, lit_factory, adder_input, output_lits[width-1])
+        if carry_out_lit is not None:
+            encode_carry_gate(clause_consumer, lit_factory, adder_input, carry_out_lit)
 
     return output_lits
 
@@ -280,62 +346,144 @@ def encode_bv_parallel_mul_gate(clause_consumer: ClauseConsumer, lit_factory: CN
     # S(2)[0:W-2] = S(1)[1:W-1] + P(2)[0:W-2]
     # S(3)[0:W-3] = S(2)[1:W-2] + P(3)[0:W-3]
 
-    def __create_fresh_lits(n):
-        return list(lit_factory.create_literal() for _ in range(0, n))
-
     width = len(lhs_input_lits)
 
     if output_lits is None:
-        output_lits = __create_fresh_lits(width)
+        output_lits = lit_factory.create_literals(width)
     else:
-        output_lits = tuple(map(lambda l: lit_factory.create_literal() if l is None else l, output_lits))
+        output_lits = ensure_tuple_or_list(output_lits)
+        if None in output_lits:
+            output_lits = tuple(lit_factory.create_literal() if l is None else l for l in output_lits)
 
     if len(rhs_input_lits) != width or len(output_lits) != width:
         raise ValueError("Mismatching bitvector sizes")
     if width == 0:
         return tuple()
 
-    # Directly include the lowermost output bit in the first partial product:
-    partial_products = [[output_lits[0]] + __create_fresh_lits(width-1)]
-    lowest_lhs = lhs_input_lits[0]
-    encode_bv_and_gate(clause_consumer, lit_factory, rhs_input_lits, [lowest_lhs] * width, partial_products[0])
-
-    # Don't compute partial sum bits which are discarded anyway:
-    if overflow_lit is not None:
-        partial_products += [encode_bv_and_gate(clause_consumer, lit_factory, rhs_input_lits, [l] * width)
-                             for l in lhs_input_lits[1:]]
-    else:
-        partial_products += [encode_bv_and_gate(clause_consumer, lit_factory,
-                                                rhs_input_lits[0:width-i], [lhs_input_lits[i]] * (width-i))
-                             for i in range(1, width)]
+    encode_and_scalar_gate = _encode_bv_and_scalar_gate
+    encode_adder_gate = encode_bv_ripple_carry_adder_gate
+    create_literals = lit_factory.create_literals
 
-    # Compute the partial sums, directly forcing the output literal setting. partial_sums[i] corresponds to S(i+1)
-    partial_sums = [([output_lits[i]] + __create_fresh_lits(width-i-1)) for i in range(1, width)]
-    # partial_sum_carries[i] is the carry bit for the computation of partial_sums[i]:
-    partial_sum_carries = __create_fresh_lits(width-1) if overflow_lit is not None else [None]*(width-1)
-
-    current_partial_sum = partial_products[0][1:width]
+    # Directly include the lowermost output bit in the first partial product:
+    lowest_partial_product = encode_and_scalar_gate(clause_consumer, lit_factory, rhs_input_lits,
+                                                    lhs_input_lits[0], [output_lits[0]] + create_literals(width-1))
+
+    # When squaring a bitvector, P(i)[j] = P(j)[i] and P(i)[i] = lhs_input_lits[i], so the AND gates
+    # computing partial product bits can be shared between the partial products:
+    is_square = all(l == r for l, r in zip(lhs_input_lits, rhs_input_lits))
+    square_partial_products = [lowest_partial_product]
+
+    def __encode_partial_product(i, n):
+        # Returns the first n bits of P(i)
+        if not is_square:
+            return encode_and_scalar_gate(clause_consumer, lit_factory, rhs_input_lits, lhs_input_lits[i],
+                                          create_literals(n))
+        result = [square_partial_products[j][i] for j in range(0, min(i, n))]
+        if n > i:
+            result.append(lhs_input_lits[i])
+            result += encode_and_scalar_gate(clause_consumer, lit_factory, lhs_input_lits[i+1:n], lhs_input_lits[i])
+        square_partial_products.append(result)
+        return result
+
+    # Compute the partial sums, directly forcing the output literal setting. Each partial product P(i) is
+    # added to the partial sum right after being encoded, so only the current partial product and partial sum
+    # need to be kept.
+    overflow_indicators = []
+    current_partial_sum = lowest_partial_product[1:width]
     for i in range(1, width):
-        current_partial_product = partial_products[i][0:width-i]
-        partial_sum_accu = partial_sums[i-1]
+        if overflow_lit is not None:
+            current_partial_product = __encode_partial_product(i, width)
+            # The bits P(i)[width-i:width] are not added, but they indicate an overflow:
+            overflow_indicators.extend(itertools.islice(current_partial_product, width-i, width))
+            current_partial_product = current_partial_product[0:width-i]
+            partial_sum_carry = lit_factory.create_literal()
+            overflow_indicators.append(partial_sum_carry)
+        else:
+            # Don't compute partial product bits which are discarded anyway:
+            current_partial_product = __encode_partial_product(i, width-i)
+            partial_sum_carry = None
+
+        partial_sum_accu = [output_lits[i]] + create_literals(width-i-1)
         assert len(current_partial_sum) == width - i
-        encode_bv_ripple_carry_adder_gate(clause_consumer, lit_factory,
-                                          lhs_input_lits=current_partial_sum,
-                                          rhs_input_lits=current_partial_product,
-                                          output_lits=partial_sum_accu,
-                                          carry_out_lit=partial_sum_carries[i-1])
+        encode_adder_gate(clause_consumer, lit_factory,
+                          lhs_input_lits=current_partial_sum,
+                          rhs_input_lits=current_partial_product,
+                          output_lits=partial_sum_accu,
+                          carry_out_lit=partial_sum_carry)
         current_partial_sum = partial_sum_accu[1:]
 
     # Check if an overflow occurred:
     if overflow_lit is not None:
-        overflow_indicators = partial_sum_carries[:]
-        for i in range(1, width):
-            overflow_indicators += partial_products[i][width-i:width]
+        if is_square:
+            # Shared partial product bits may occur multiple times:
+            overflow_indicators = list(dict.fromkeys(overflow_indicators))
         gates.encode_or_gate(clause_consumer, lit_factory, overflow_indicators, overflow_lit)
 
     return output_lits
 
 
+def _encode_leq_step(clause_consumer: ClauseConsumer, lhs_lit, rhs_lit, rest_leq_lit, output_lit):
+    """
+    Encodes the constraint output_lit <-> ((-lhs_lit and rhs_lit) or (lhs_lit == rhs_lit and rest_leq_lit)),
+    i.e. one step of a less-than-or-equal-to comparison of bitvectors, with rest_leq_lit representing the
+    comparison result for the less significant bits.
+
+    This constraint is equivalent to output_lit <-> majority(-lhs_lit, rhs_lit, rest_leq_lit) and is encoded
+    using 6 ternary clauses, without introducing new variables.
+
+    :param clause_consumer: The clause consumer to which the clauses of the gate encoding shall be added.
+    :param lhs_lit: The left-hand-side bit.
+    :param rhs_lit: The right-hand-side bit.
+    :param rest_leq_lit: The comparison result for the less significant bits.
+    :param output_lit: The gate's output literal.
+    :return: None
+    """
+    for x in ((lhs_lit, -rhs_lit, output_lit),
+              (-lhs_lit, rhs_lit, -output_lit),
+              (lhs_lit, -rest_leq_lit, output_lit),
+              (-rhs_lit, -rest_leq_lit, output_lit),
+              (-lhs_lit, rest_leq_lit, -output_lit),
+              (rhs_lit, rest_leq_lit, -output_lit)):
+        clause_consumer.consume_clause(x)
+
+
+def _encode_bv_ule_prefix_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralFactory,
+                               lhs_input_lits, rhs_input_lits, width, output_lit):
+    """
+    Encodes a less-than-or-equal-to-comparison gate for the lowermost `width` bits of the given bitvectors,
+    representing unsigned integers. The bits are accessed by index, so no slices of the bitvectors need
+    to be created.
+
+    :param clause_consumer: The clause consumer to which the clauses of the gate encoding shall be added.
+    :param lit_factory: The CNF literal factory to be used for creating literals with new variables.
+    :param lhs_input_lits: The list or tuple of left-hand-side input literals, containing at least `width` literals.
+    :param rhs_input_lits: The list or tuple of right-hand-side input literals, containing at least `width`
+                           literals.
+    :param width: The number of compared bits.
+    :param output_lit: The gate's output literal.
+    :return: The encoded gate's output literal.
+    """
+    if width == 0:
+        clause_consumer.consume_clause((output_lit,))
+        return output_lit
+
+    # Iteration: lhs[0:i+1] <= rhs[0:i+1] <-> (lhs[i] < rhs[i] or (lhs[i] == rhs[i] and lhs[0:i] <= rhs[0:i]))
+    # The comparison of the empty bitvectors lhs[0:0] and rhs[0:0] is constantly true, so for the LSB:
+    # lhs[0:1] <= rhs[0:1] <-> (-lhs[0] or rhs[0])
+    lhs_lsb, rhs_lsb = lhs_input_lits[0], rhs_input_lits[0]
+    rest_leq = output_lit if width == 1 else lit_factory.create_literal()
+    clause_consumer.consume_clause((lhs_lsb, rest_leq))
+    clause_consumer.consume_clause((-rhs_lsb, rest_leq))
+    clause_consumer.consume_clause((-lhs_lsb, rhs_lsb, -rest_leq))
+
+    for i in range(1, width):
+        bit_leq = output_lit if i == width-1 else lit_factory.create_literal()
+        _encode_leq_step(clause_consumer, lhs_input_lits[i], rhs_input_lits[i], rest_leq, bit_leq)
+        rest_leq = bit_leq
+
+    return output_lit
+
+
 def encode_bv_ule_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralFactory,
                        lhs_input_lits, rhs_input_lits, output_lit=None):
     """
@@ -360,26 +508,8 @@ def encode_bv_ule_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralF
     if output_lit is None:
         output_lit = lit_factory.create_literal()
 
-    # Base cases:
-    if len(lhs_input_lits) == 0:
-        clause_consumer.consume_clause((output_lit,))
-        return output_lit
-
-    if len(lhs_input_lits) == 1:
-        gates.encode_and_gate(clause_consumer, lit_factory, (lhs_input_lits[0], -rhs_input_lits[0]), -output_lit)
-        return output_lit
-
-    # Recursion: lhs <= rhs <-> (lhs[0] < rhs[0] or (lhs[0] == rhs[0] and lhs[1:] <= rhs[1:])
-    width = len(lhs_input_lits)
-    rest_leq = encode_bv_ule_gate(clause_consumer, lit_factory,
-                                  lhs_input_lits[:width-1], rhs_input_lits[:width-1])
-
-    lhs_msb, rhs_msb = lhs_input_lits[width-1], rhs_input_lits[width-1]
-    msb_is_lt = gates.encode_and_gate(clause_consumer, lit_factory, (-lhs_msb, rhs_msb))
-    msb_is_eq = -gates.encode_binary_xor_gate(clause_consumer, lit_factory, (lhs_msb, rhs_msb))
-
-    leq_if_first_is_eq = gates.encode_and_gate(clause_consumer, lit_factory, (msb_is_eq, rest_leq))
-    return gates.encode_or_gate(clause_consumer, lit_factory, (msb_is_lt, leq_if_first_is_eq), output_lit)
+    return _encode_bv_ule_prefix_gate(clause_consumer, lit_factory, lhs_input_lits, rhs_input_lits,
+                                      len(lhs_input_lits), output_lit)
 
 
 def encode_bv_sle_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralFactory,
@@ -417,15 +547,58 @@ def encode_bv_sle_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralF
     width = len(lhs_input_lits)
     lhs_msb = lhs_input_lits[width-1]
     rhs_msb = rhs_input_lits[width-1]
-    rest_leq = encode_bv_ule_gate(clause_consumer, lit_factory,
-                                  lhs_input_lits=lhs_input_lits[:width-1],
-                                  rhs_input_lits=rhs_input_lits[:width-1])
-    msb_eq = -gates.encode_binary_xor_gate(clause_consumer, lit_factory, input_lits=(lhs_msb, rhs_msb))
-    same_sign_and_leq = gates.encode_and_gate(clause_consumer, lit_factory, input_lits=(msb_eq, rest_leq))
-    lhs_neg_and_rhs_pos = gates.encode_and_gate(clause_consumer, lit_factory, input_lits=(lhs_msb, -rhs_msb))
-    return gates.encode_or_gate(clause_consumer, lit_factory,
-                                input_lits=(lhs_neg_and_rhs_pos, same_sign_and_leq),
-                                output_lit=output_lit)
+    rest_leq = _encode_bv_ule_prefix_gate(clause_consumer, lit_factory, lhs_input_lits, rhs_input_lits,
+                                          width-1, lit_factory.create_literal())
+    # lhs <= rhs <-> ((lhs_msb and -rhs_msb) or (lhs_msb == rhs_msb and lhs[:width-1] <= rhs[:width-1])),
+    # which is an unsigned comparison step with inverted sign bits:
+    _encode_leq_step(clause_consumer, -lhs_msb, -rhs_msb, rest_leq, output_lit)
+    return output_lit
+
+
+def encode_bv_ule_and_sle_gates(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralFactory,
+                                lhs_input_lits, rhs_input_lits, ule_output_lit=None, sle_output_lit=None):
+    """
+    Encodes both an unsigned and a signed (two's complement) less-than-or-equal-to-comparison gate for the
+    same pair of bitvectors. The comparison of all bits but the most significant ones is shared between the
+    two gates, so this encoding is smaller than separately using encode_bv_ule_gate and encode_bv_sle_gate.
+
+    :param clause_consumer: The clause consumer to which the clauses of the gate encoding shall be added.
+    :param lit_factory: The CNF literal factory to be used for creating literals with new variables.
+    :param lhs_input_lits: The iterable of left-hand-side input literals.
+    :param rhs_input_lits: The iterable of right-hand-side input literals. The length of rhs_input_lits must
+                           be the same as the length of lhs_input_lits.
+    :param ule_output_lit: The unsigned comparison gate's output literal. If ule_output_lit is None, a positive
+                           literal with a new variable will be used as the gate's output literal.
+    :param sle_output_lit: The signed comparison gate's output literal. If sle_output_lit is None, a positive
+                           literal with a new variable will be used as the gate's output literal.
+    :return: The tuple (u, s) with u being the unsigned comparison gate's output literal and s being the
+             signed comparison gate's output literal.
+    """
+
+    lhs_input_lits = ensure_tuple_or_list(lhs_input_lits)
+    rhs_input_lits = ensure_tuple_or_list(rhs_input_lits)
+
+    if len(lhs_input_lits) != len(rhs_input_lits):
+        raise ValueError("Sizes of lhs_input_lits and rhs_input_lits illegally mismatching")
+
+    if ule_output_lit is None:
+        ule_output_lit = lit_factory.create_literal()
+    if sle_output_lit is None:
+        sle_output_lit = lit_factory.create_literal()
+
+    width = len(lhs_input_lits)
+    if width == 0:
+        clause_consumer.consume_clause((ule_output_lit,))
+        clause_consumer.consume_clause((sle_output_lit,))
+        return ule_output_lit, sle_output_lit
+
+    lhs_msb = lhs_input_lits[width-1]
+    rhs_msb = rhs_input_lits[width-1]
+    rest_leq = _encode_bv_ule_prefix_gate(clause_consumer, lit_factory, lhs_input_lits, rhs_input_lits,
+                                          width-1, lit_factory.create_literal())
+    _encode_leq_step(clause_consumer, lhs_msb, rhs_msb, rest_leq, ule_output_lit)
+    _encode_leq_step(clause_consumer, -lhs_msb, -rhs_msb, rest_leq, sle_output_lit)
+    return ule_output_lit, sle_output_lit
 
 
 def encode_bv_eq_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralFactory,
@@ -452,8 +625,19 @@ def encode_bv_eq_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralFa
     if output_lit is None:
         output_lit = lit_factory.create_literal()
 
-    differences = encode_bv_xor_gate(clause_consumer, lit_factory, lhs_input_lits, rhs_input_lits)
-    gates.encode_or_gate(clause_consumer, lit_factory, differences, -output_lit)
+    # differences[i] <-> (lhs_input_lits[i] XOR rhs_input_lits[i])
+    # output_lit <-> AND(-differences[0], ..., -differences[N-1])
+    # The clauses are emitted directly instead of using the XOR and OR gate encoders.
+    differences = lit_factory.create_literals(len(lhs_input_lits))
+    consume_clause = clause_consumer.consume_clause
+    for lhs, rhs, diff in zip(lhs_input_lits, rhs_input_lits, differences):
+        consume_clause((lhs, rhs, -diff))
+        consume_clause((-lhs, -rhs, -diff))
+        consume_clause((lhs, -rhs, diff))
+        consume_clause((-lhs, rhs, diff))
+        consume_clause((-diff, -output_lit))
+    differences.append(output_lit)
+    consume_clause(differences)
     return output_lit
 
 
@@ -486,14 +670,14 @@ def encode_bv_mux_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralF
 
     select_lhs_lit = lit_factory.create_literal() if select_lhs_lit is None else select_lhs_lit
 
-    lhs_selection = encode_bv_and_gate(clause_consumer=clause_consumer,
-                                       lit_factory=lit_factory,
-                                       lhs_input_lits=lhs_input_lits,
-                                       rhs_input_lits=[select_lhs_lit]*len(lhs_input_lits))
-    rhs_selection = encode_bv_and_gate(clause_consumer=clause_consumer,
-                                       lit_factory=lit_factory,
-                                       lhs_input_lits=rhs_input_lits,
-                                       rhs_input_lits=[-select_lhs_lit]*len(rhs_input_lits))
+    lhs_selection = _encode_bv_and_scalar_gate(clause_consumer=clause_consumer,
+                                               lit_factory=lit_factory,
+                                               input_lits=lhs_input_lits,
+                                               scalar_lit=select_lhs_lit)
+    rhs_selection = _encode_bv_and_scalar_gate(clause_consumer=clause_consumer,
+                                               lit_factory=lit_factory,
+                                               input_lits=rhs_input_lits,
+                                               scalar_lit=-select_lhs_lit)
     return encode_bv_or_gate(clause_consumer=clause_consumer,
                              lit_factory=lit_factory,
                              lhs_input_lits=lhs_selection,
@@ -527,7 +711,7 @@ def encode_staggered_or_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLi
         return tuple()
 
     if output_lits is None:
-        result = tuple(lit_factory.create_literal() for _ in range(0, width))
+        result = tuple(lit_factory.create_literals(width))
     else:
         result = tuple(out_lit if out_lit is not None else lit_factory.create_literal() for out_lit in output_lits)
 
@@ -577,16 +761,13 @@ def encode_bv_long_udiv_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLi
     if width == 0:
         return tuple()
 
-    def __create_fresh_lits(n):
-        return tuple(lit_factory.create_literal() for _ in range(0, n))
-
     constantly_false = lit_factory.create_literal()
     clause_consumer.consume_clause((-constantly_false,))
 
     divisor_any_higher_bits_nonzero = encode_staggered_or_gate(clause_consumer=clause_consumer, lit_factory=lit_factory,
                                                                input_lits=rhs_input_lits)
 
-    quotient = __create_fresh_lits(width)
+    quotient = tuple(lit_factory.create_literals(width))
 
     remainder = list()
     for step_idx in reversed(range(0, width)):
@@ -600,9 +781,12 @@ def encode_bv_long_udiv_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLi
         else:
             # divisor has more bits than the remainder. Save some variable introductions by comparing the divisor's
             # extra bits separately:
-            lower_bit_comparison = encode_bv_ule_gate(clause_consumer=clause_consumer, lit_factory=lit_factory,
-                                                      lhs_input_lits=rhs_input_lits[0:len(remainder)],
-                                                      rhs_input_lits=remainder)
+            lower_bit_comparison = _encode_bv_ule_prefix_gate(clause_consumer=clause_consumer,
+                                                              lit_factory=lit_factory,
+                                                              lhs_input_lits=rhs_input_lits,
+                                                              rhs_input_lits=remainder,
+                                                              width=len(remainder),
+                                                              output_lit=lit_factory.create_literal())
             higher_bits_comparison = divisor_any_higher_bits_nonzero[len(remainder)]
             gates.encode_and_gate(clause_consumer=clause_consumer, lit_factory=lit_factory,
                                   input_lits=(lower_bit_comparison, -higher_bits_comparison),
@@ -623,14 +807,14 @@ def encode_bv_long_udiv_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLi
 
     # If the user specified remainder literals, use them when appropriate
     if remainder_output_lits is not None:
-        encode_bv_and_gate(clause_consumer=clause_consumer, lit_factory=lit_factory,
-                           lhs_input_lits=[-rhs_is_zero] * width, rhs_input_lits=remainder,
-                           output_lits=remainder_output_lits)
+        _encode_bv_and_scalar_gate(clause_consumer=clause_consumer, lit_factory=lit_factory,
+                                   input_lits=remainder, scalar_lit=-rhs_is_zero,
+                                   output_lits=ensure_tuple_or_list(remainder_output_lits))
 
     # Tie the gate output to False if rhs is 0:
-    return encode_bv_and_gate(clause_consumer=clause_consumer, lit_factory=lit_factory,
-                              lhs_input_lits=[-rhs_is_zero]*width, rhs_input_lits=quotient,
-                              output_lits=output_lits)
+    return _encode_bv_and_scalar_gate(clause_consumer=clause_consumer, lit_factory=lit_factory,
+                                      input_lits=quotient, scalar_lit=-rhs_is_zero,
+                                      output_lits=output_lits)
 
 
 def encode_bv_long_urem_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLiteralFactory,
@@ -693,12 +877,12 @@ def encode_bv_popcount_gate(clause_consumer: ClauseConsumer, lit_factory: CNFLit
 
     len_output_lits = int(math.ceil(math.log2(len(input_lits)+1)))
     if output_lits is None:
-        output_lits = tuple(lit_factory.create_literal() for _ in range(0, len_output_lits))
+        output_lits = tuple(lit_factory.create_literals(len_output_lits))
     elif len(output_lits) != len_output_lits:
         raise ValueError("Mismatching output bitvector size")
 
     if len(input_lits) == 1:
-        return gates.encode_and_gate(clause_consumer, lit_factory, [input_lits[0]], output_lits[0]),
+        return gates.encode_and_gate(clause_consumer, lit_factory, (input_lits[0],), output_lits[0]),
 
     if len(input_lits) == 2:
         # encode a half adder:
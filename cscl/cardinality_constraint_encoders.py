@@ -16,27 +16,23 @@ def subsets_of_size_k(collection, k):
     :param k: A non-negative integer.
     :return: A list containing all size-k subsets of collection.
     """
-    # Potential optimization: make this a generator
-
     assert(k >= 0)
+    return [list(subset) for subset in itertools.combinations(collection, k)]
 
-    # Base cases:
-    if k > len(collection):
-        return []
-    if k == 0:
-        return [[]]
-    if k == len(collection):
-        return [collection]
 
-    next_smaller_subsets = subsets_of_size_k(collection[1:], k-1)
-    next_subsets = subsets_of_size_k(collection[1:], k)
+def iter_at_most_k_constraint_binomial(lit_factory: CNFLiteralFactory, k: int, constrained_lits: list):
+    """
+    Generates the clauses of the binomial at-most-k constraint encoding lazily.
 
-    def extend_list(lst, item):
-        lst_copy = lst[:]
-        lst_copy.append(item)
-        return lst_copy
+    See encode_at_most_k_constraint_binomial() for a description of the encoding.
 
-    return next_subsets + list(map(lambda x: extend_list(x, collection[0]), next_smaller_subsets))
+    :param lit_factory: The literal factory to be used for creating literals with new CNF variables.
+    :param k: See encode_at_most_k_constraint_binomial().
+    :param constrained_lits: The literals to be constrained.
+    :return: An iterator over the constraint's clauses, each being a list of literals.
+    """
+    negated_lits = [-x for x in constrained_lits]
+    return map(list, itertools.combinations(negated_lits, k+1))
 
 
 def encode_at_most_k_constraint_binomial(lit_factory: CNFLiteralFactory, k: int, constrained_lits: list):
@@ -52,67 +48,111 @@ def encode_at_most_k_constraint_binomial(lit_factory: CNFLiteralFactory, k: int,
     :param constrained_lits: The literals to be constrained.
     :return: The constraint in CNF clausal form, a list of lists of literals.
     """
-
-    result = []
-    for subset in subsets_of_size_k(constrained_lits, k+1):
-        result.append(list(map(lambda x: -x, subset)))
-    return result
+    return list(iter_at_most_k_constraint_binomial(lit_factory, k, constrained_lits))
 
 
-def encode_at_most_k_constraint_ltseq(lit_factory: CNFLiteralFactory, k: int, constrained_lits: list):
+def iter_at_most_k_constraint_ltseq(lit_factory: CNFLiteralFactory, k: int, constrained_lits: list):
     """
-    Creates a CNF constraint C such that for all literal assignments L of C, the following holds:
-    At most k of the literals contained in constrained_lits are assigned true.
+    Generates the clauses of the sequential counter at-most-k constraint encoding lazily.
 
-    This encoder uses the sequential counter encoding, producing O(k*len(constrained_lits)) clauses
-    and O(k*len(constrained_lits)) new variables.
-
-    Source for this encoding:
-     Carsten Sinz. Towards an optimal CNF encoding of Boolean cardinality constraints.
-     In Proc. of the 11th Intl. Conf. on Principles and Practice of Constraint Program-
-     ming (CP 2005), pages 827–831, Sitges, Spain, October 2005.
+    See encode_at_most_k_constraint_ltseq() for a description of the encoding. The new
+    variables of the encoding are created when the iteration starts.
 
     :param lit_factory: The literal factory to be used for creating literals with new CNF variables.
-    :param k: See above.
+    :param k: See encode_at_most_k_constraint_ltseq().
     :param constrained_lits: The literals to be constrained.
-    :return: The constraint in CNF clausal form, a list of lists of literals.
+    :return: An iterator over the constraint's clauses, each being a list of literals.
     """
     if k == 0:
-        return list(map(lambda x: [-x], constrained_lits))
-    if len(constrained_lits) == 0:
-        return []
-    if len(constrained_lits) == 1:
+        for x in constrained_lits:
+            yield [-x]
+        return
+    if len(constrained_lits) <= 1:
         # Here, k >= len(constrained_lits)
-        return []
+        return
+    if k == 1:
+        yield from _iter_at_most_one_constraint_ltseq(lit_factory, constrained_lits)
+        return
 
     n = len(constrained_lits)
-    registers = []
-    for i in range(0, n):
-        register = tuple(lit_factory.create_literal() for _ in range(0, k))
-        registers.append(register)
-    # registers[i][j] represents the j'th bit of register i
-    # register[i] represents (as a unary number) the number of literals in constrained_lits[0],
+    registers = lit_factory.create_literals((n-1)*k)
+    neg_registers = [-x for x in registers]
+    # registers[i*k + j] represents the j'th bit of register i
+    # register i represents (as a unary number) the number of literals in constrained_lits[0],
     # ..., constrained_lits[i] that are assigned to true.
+    # The register for constrained_lits[n-1] is not needed, since no clause refers to it.
 
     # See the source paper for a description of the encoding
-    result = [[-constrained_lits[0], registers[0][0]]]
+    yield [-constrained_lits[0], registers[0]]
 
-    for i in range(1, k):
-        result.append([-registers[0][i]])
+    for j in range(1, k):
+        yield [neg_registers[j]]
 
     for i in range(1, n-1):
-        result.append([-constrained_lits[i], registers[i][0]])
-        result.append([-registers[i-1][0], registers[i][0]])
+        neg_lit = -constrained_lits[i]
+        row = i*k
+        prev_row = row - k
+
+        yield [neg_lit, registers[row]]
+        yield [neg_registers[prev_row], registers[row]]
 
         for j in range(1, k):
-            result.append([-constrained_lits[i], -registers[i-1][j-1], registers[i][j]])
-            result.append([-registers[i-1][j], registers[i][j]])
+            yield [neg_lit, neg_registers[prev_row + j - 1], registers[row + j]]
+            yield [neg_registers[prev_row + j], registers[row + j]]
+
+        yield [neg_lit, neg_registers[row - 1]]
+
+    yield [-constrained_lits[n-1], neg_registers[(n-1)*k - 1]]
+
+
+def _iter_at_most_one_constraint_ltseq(lit_factory: CNFLiteralFactory, constrained_lits: list):
+    """
+    Generates the clauses of the sequential counter encoding for k=1, with len(constrained_lits) >= 2.
 
-        result.append([-constrained_lits[i], -registers[i-1][k-1]])
+    With single-bit registers, the sequential counter encoding consists of three binary clauses per
+    constrained literal. For at most 4 constrained literals, the pairwise (i.e. binomial) encoding is
+    used instead, since it requires no more clauses and no new variables.
+
+    :param lit_factory: The literal factory to be used for creating literals with new CNF variables.
+    :param constrained_lits: The literals to be constrained.
+    :return: An iterator over the constraint's clauses, each being a list of literals.
+    """
+    n = len(constrained_lits)
+    if n <= 4:
+        yield from iter_at_most_k_constraint_binomial(lit_factory, 1, constrained_lits)
+        return
+
+    # registers[i] is true if one of constrained_lits[0], ..., constrained_lits[i] is true
+    registers = lit_factory.create_literals(n-1)
+    yield [-constrained_lits[0], registers[0]]
+    for i in range(1, n-1):
+        neg_lit = -constrained_lits[i]
+        neg_prev_register = -registers[i-1]
+        yield [neg_lit, registers[i]]
+        yield [neg_prev_register, registers[i]]
+        yield [neg_lit, neg_prev_register]
+    yield [-constrained_lits[n-1], -registers[n-2]]
+
+
+def encode_at_most_k_constraint_ltseq(lit_factory: CNFLiteralFactory, k: int, constrained_lits: list):
+    """
+    Creates a CNF constraint C such that for all literal assignments L of C, the following holds:
+    At most k of the literals contained in constrained_lits are assigned true.
+
+    This encoder uses the sequential counter encoding, producing O(k*len(constrained_lits)) clauses
+    and O(k*len(constrained_lits)) new variables.
 
-    result.append([-constrained_lits[n-1], -registers[n-2][k-1]])
+    Source for this encoding:
+     Carsten Sinz. Towards an optimal CNF encoding of Boolean cardinality constraints.
+     In Proc. of the 11th Intl. Conf. on Principles and Practice of Constraint Program-
+     ming (CP 2005), pages 827–831, Sitges, Spain, October 2005.
 
-    return result
+    :param lit_factory: The literal factory to be used for creating literals with new CNF variables.
+    :param k: See above.
+    :param constrained_lits: The literals to be constrained.
+    :return: The constraint in CNF clausal form, a list of lists of literals.
+    """
+    return list(iter_at_most_k_constraint_ltseq(lit_factory, k, constrained_lits))
 
 
 def chunks(l: list, chunk_size: int):
@@ -128,14 +168,8 @@ def chunks(l: list, chunk_size: int):
     if chunk_size <= 0:
         raise ValueError("chunk_size must not be 0 or negative")
 
-    total_items_yielded = 0
-    while total_items_yielded < len(l):
-        if total_items_yielded + chunk_size >= len(l):
-            yield l[total_items_yielded:]
-            total_items_yielded = len(l)
-        else:
-            yield l[total_items_yielded:total_items_yielded+chunk_size]
-            total_items_yielded += chunk_size
+    for chunk_start in range(0, len(l), chunk_size):
+        yield l[chunk_start:chunk_start+chunk_size]
 
 
 def encode_at_least_k_constraint(lit_factory: CNFLiteralFactory, k: int, constrained_lits: list,
@@ -152,9 +186,27 @@ def encode_at_least_k_constraint(lit_factory: CNFLiteralFactory, k: int, constra
     :param encode_at_most_k_constraint_fn: an at-most-k constraint encoder function.
     :return: The constraint in CNF clausal form, a list of lists of literals.
     """
+    if encode_at_most_k_constraint_fn is encode_at_most_k_constraint_binomial:
+        return list(_iter_at_least_k_constraint_binomial(k, constrained_lits))
     return encode_at_most_k_constraint_fn(lit_factory, len(constrained_lits)-k, [-l for l in constrained_lits])
 
 
+def _iter_at_least_k_constraint_binomial(k: int, constrained_lits: list):
+    """
+    Generates the clauses of the binomial at-most-(len(constrained_lits)-k) constraint over the negations
+    of constrained_lits, i.e. of an at-least-k constraint over constrained_lits.
+
+    Since the binomial encoder negates the constrained literals again, its clauses are simply the subsets
+    of constrained_lits with size len(constrained_lits)-k+1, which are generated here without negating
+    the literals twice.
+
+    :param k: See encode_at_least_k_constraint().
+    :param constrained_lits: The literals to be constrained.
+    :return: An iterator over the constraint's clauses, each being a list of literals.
+    """
+    return map(list, itertools.combinations(constrained_lits, len(constrained_lits)-k+1))
+
+
 def encode_exactly_k_constraint(lit_factory: CNFLiteralFactory, k: int, constrained_lits: list,
                                 encode_at_most_k_constraint_fn):
     """
@@ -173,6 +225,69 @@ def encode_exactly_k_constraint(lit_factory: CNFLiteralFactory, k: int, constrai
         + encode_at_least_k_constraint(lit_factory, k, constrained_lits, encode_at_most_k_constraint_fn)
 
 
+def iter_at_most_k_constraint_commander(lit_factory: CNFLiteralFactory, k: int, constrained_lits: list):
+    """
+    Generates the clauses of the commander at-most-k constraint encoding lazily.
+
+    See encode_at_most_k_constraint_commander() for a description of the encoding. The new
+    variables of the encoding are created level by level while iterating, so clauses can
+    be passed to a clause consumer before the entire constraint has been encoded.
+
+    :param lit_factory: The literal factory to be used for creating literals with new CNF variables.
+    :param k: See encode_at_most_k_constraint_commander().
+    :param constrained_lits: The literals to be constrained.
+    :return: An iterator over the constraint's clauses, each being a list of literals.
+    """
+    if k == 0:
+        for x in constrained_lits:
+            yield [-x]
+        return
+    if len(constrained_lits) <= 1 or len(constrained_lits) <= k:
+        # at-most-k constraint is always satisfied, don't add any constraining clauses
+        return
+
+    # See the cited paper for a description of the encoding. Instead of recursing on the
+    # commander literals, the encoding is applied level by level until at most k literals
+    # remain to be constrained.
+    level_lits = constrained_lits
+    while len(level_lits) > k:
+        group_size = min(k+2, len(level_lits))
+        groups = list(chunks(level_lits, group_size))
+
+        if len(groups) * k >= len(level_lits):
+            # Introducing commander literals would not reduce the amount of literals to constrain
+            # on the next level (e.g. for k=3 and 6 literals), so finish with a direct encoding:
+            yield from iter_at_most_k_constraint_binomial(lit_factory, k, level_lits)
+            return
+
+        # commanders[i][j] corresponds to c_{i,j} in the source paper:
+        level_commanders = lit_factory.create_literals(len(groups) * k)
+        commanders = [level_commanders[i:i+k] for i in range(0, len(level_commanders), k)]
+        neg_level_commanders = [-c for c in level_commanders]
+
+        # For each group, add at-least-k and at-most-k constraints for the group and its commander literals:
+        for idx, group in enumerate(groups):
+            group_with_commanders = group + neg_level_commanders[idx*k:(idx+1)*k]
+            # Equivalent to encode_exactly_k_constraint() using the binomial encoding, but without
+            # creating intermediate clause lists:
+            yield from iter_at_most_k_constraint_binomial(lit_factory, k, group_with_commanders)
+            yield from _iter_at_least_k_constraint_binomial(k, group_with_commanders)
+
+        # Break symmetries by ordering the commander literals:
+        for group_commanders in commanders:
+            for i in range(0, k-1):
+                yield [-group_commanders[i], group_commanders[i+1]]
+
+        # At most k commander literals may be true at any time:
+        level_lits = level_commanders
+
+        if k == 1:
+            # For a single commander literal per group, the binary encoding needs O(n*log(n))
+            # clauses for the remaining levels, where n is the amount of commander literals:
+            yield from encode_at_most_one_constraint_binary(lit_factory, level_lits)
+            return
+
+
 def encode_at_most_k_constraint_commander(lit_factory: CNFLiteralFactory, k: int, constrained_lits: list):
     """
     Creates a CNF constraint C such that for all literal assignments L of C, the following holds:
@@ -189,34 +304,30 @@ def encode_at_most_k_constraint_commander(lit_factory: CNFLiteralFactory, k: int
     :param constrained_lits: The literals to be constrained.
     :return: The constraint in CNF clausal form, a list of lists of literals.
     """
-    if k == 0:
-        return list(map(lambda x: [-x], constrained_lits))
-    if len(constrained_lits) <= 1 or len(constrained_lits) <= k:
-        # at-most-k constraint is always satisfied, don't add any constraining clauses
-        return []
-
-    # See the cited paper for a description of the encoding.
+    return list(iter_at_most_k_constraint_commander(lit_factory, k, constrained_lits))
 
-    group_size = min(k+2, len(constrained_lits))
-    groups = list(chunks(constrained_lits, group_size))
 
-    # commanders[i][j] corresponds to c_{i,j} in the source paper:
-    commanders = [[lit_factory.create_literal() for _ in range(0, k)] for _ in groups]
+def encode_at_most_one_constraint_binary(lit_factory: CNFLiteralFactory, constrained_lits: list):
+    """
+    Creates a CNF constraint C such that for all literal assignments L of C, the following holds:
+    At most one of the literals contained in constrained_lits is assigned true.
 
-    # For each group, add at-least-k and at-most-k constraints for the group and its commander literals:
-    group_constraints = []
-    for idx, group in enumerate(groups):
-        group_with_commanders = group + [-c for c in commanders[idx]]
-        group_constraints += encode_exactly_k_constraint(lit_factory, k, group_with_commanders,
-                                                         encode_at_most_k_constraint_binomial)
+    This encoder uses the binary encoding, producing len(constrained_lits)*ceil(log2(len(constrained_lits)))
+    binary clauses and ceil(log2(len(constrained_lits))) new variables. Each constrained literal being
+    assigned true forces the new variables to represent its index in binary.
 
-    # Break symmetries by ordering the commander literals:
-    order_commanders = [[-group_commanders[i], group_commanders[i+1]]
-                        for group_commanders, i in itertools.product(commanders, range(0, k-1))]
+    Source for this encoding:
+     Frisch, Alan M., and Paul A. Giannaros. "Sat encodings of the at-most-k constraint. some old, some new, some fast,
+     some slow." Proc. of the Tenth Int. Workshop of Constraint Modelling and Reformulation. 2010.
 
-    # At most k commander literals may be true at any time:
-    flat_commanders = [c for group_commanders in commanders for c in group_commanders]
-    at_most_k_commanders = encode_at_most_k_constraint_commander(lit_factory=lit_factory, k=k,
-                                                                 constrained_lits=flat_commanders)
+    :param lit_factory: The literal factory to be used for creating literals with new CNF variables.
+    :param constrained_lits: The literals to be constrained.
+    :return: The constraint in CNF clausal form, a list of lists of literals.
+    """
+    if len(constrained_lits) <= 1:
+        return []
 
-    return group_constraints + order_commanders + at_most_k_commanders
+    index_bits = lit_factory.create_literals((len(constrained_lits)-1).bit_length())
+    return [[-lit, bit if (idx >> bit_idx) & 1 else -bit]
+            for idx, lit in enumerate(constrained_lits)
+            for bit_idx, bit in enumerate(index_bits)]
@@ -17,6 +17,16 @@ class DIMACSPrinter(ClauseConsumer, CNFLiteralFactory):
         self.num_vars += 1
         return self.num_vars
 
+    def create_literals(self, n: int):
+        first_var = self.num_vars + 1
+        self.num_vars += n
+        return list(range(first_var, self.num_vars + 1))
+
+    def __lines(self):
+        yield "p cnf " + str(self.num_vars) + " " + str(len(self.clauses))
+        for clause in self.clauses:
+            yield ' '.join(map(str, clause)) + " 0"
+
     def print(self, line_print_fn):
         """
         Prints the collected clauses using the given printing function.
@@ -25,6 +35,17 @@ class DIMACSPrinter(ClauseConsumer, CNFLiteralFactory):
                               is passed line-by-line to line_print_fn.
         :return: None
         """
-        line_print_fn("p cnf " + str(self.num_vars) + " " + str(len(self.clauses)))
-        for clause in self.clauses:
-            line_print_fn((' '.join(map(str, clause))) + " 0")
+        for line in self.__lines():
+            line_print_fn(line)
+
+    def print_bulk(self, print_fn):
+        """
+        Prints the collected clauses using the given printing function, passing the entire DIMACS output
+        to it at once. For large problems, this is considerably faster than print() when writing to a file.
+
+        :param print_fn: A function accepting a string as its sole argument, e.g. the write method of a
+                         text file. The DIMACS output is passed to print_fn as a single string, with each
+                         line being terminated by a newline character.
+        :return: None
+        """
+        print_fn('\n'.join(self.__lines()) + '\n')
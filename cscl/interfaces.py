@@ -17,6 +17,18 @@ class CNFLiteralFactory(abc.ABC):
         """
         pass
 
+    def create_literals(self, n: int):
+        """
+        Creates n literals with new variables.
+
+        This is equivalent to calling create_literal() n times. Literal factories should override this method
+        if they are able to create multiple literals at once more efficiently.
+
+        :param n: A non-negative integer.
+        :return: A list of n literals, each satisfying the postconditions of create_literal().
+        """
+        return [self.create_literal() for _ in range(0, n)]
+
 
 class ClauseConsumer(abc.ABC):
     """A role interface for clause consumers, e.g. SAT solvers or CNF formula builders"""
@@ -47,30 +47,41 @@ class IPASIRSatSolverResource:
                 self.destroy()
 
             def consume_clause(self, clause):
+                # IPASIR has no function for adding an entire clause, so at least avoid looking up
+                # the ctypes function and the solver pointer for each literal:
+                ipasir_add = self.dso.ipasir_add
+                solver = self.solver
                 for lit in clause:
-                    self.dso.ipasir_add(self.solver, lit)
-                self.dso.ipasir_add(self.solver, 0)
+                    ipasir_add(solver, lit)
+                ipasir_add(solver, 0)
 
             def create_literal(self):
                 self.num_vars += 1
                 return self.num_vars
 
+            def create_literals(self, n):
+                first_var = self.num_vars + 1
+                self.num_vars += n
+                return list(range(first_var, self.num_vars + 1))
+
             def solve(self, assumptions):
                 for lit in assumptions:
                     self.dso.ipasir_assume(self.solver, lit)
                 return self.dso.ipasir_solve(self.solver)
 
             def get_assignment(self, lit):
-                ipasir_assignment = self.dso.ipasir_val(self.solver, var)
+                # ipasir_val() returns lit if lit is true, -lit if lit is false and 0 if
+                # the value of lit is irrelevant for satisfying the problem:
+                ipasir_assignment = self.dso.ipasir_val(self.solver, lit)
                 if ipasir_assignment == 0:
                     return None
                 else:
-                    return True if ipasir_assignment > 0 else False
+                    return ipasir_assignment == lit
 
             def destroy(self):
-                if self.solver is not None:
-                    self.solver = None
-                    self.dso.ipasir_release(self.solver)
+                solver, self.solver = self.solver, None
+                if solver is not None:
+                    self.dso.ipasir_release(solver)
 
         self.sat_solver = IPASIRSatSolverImpl(self.__path_to_solver_dso)
         return self.sat_solver
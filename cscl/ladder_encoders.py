@@ -35,6 +35,6 @@ def encode_ladder_constraint(clause_consumer: ClauseConsumer, lit_factory: CNFLi
     if num_vars < 0:
         raise ValueError('num_vars must not be negative')
 
-    ladder_lits = tuple(lit_factory.create_literal() for _ in range(0, num_vars))
+    ladder_lits = tuple(lit_factory.create_literals(num_vars))
     encode_ladder_constraint_on_literals(clause_consumer, ladder_lits)
     return ladder_lits
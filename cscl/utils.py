@@ -1,5 +1,4 @@
 from cscl.interfaces import ClauseConsumer
-import itertools
 
 
 def ensure_tuple_or_list(x):
@@ -17,6 +16,9 @@ def with_activation_literals(clause_consumer: ClauseConsumer, activation_literal
     """
     Decorates a ClauseConsumer such that it adds the given literals to each clause.
 
+    Literals of a clause that are also activation literals are not added twice. Other duplicate
+    literals within a clause are forwarded unchanged.
+
     :param clause_consumer:     A clause consumer.
     :param activation_literals: An iterable of literals.
     :return: A clause consumer that forwards clauses  to `clause_consumer`, adding the
@@ -25,10 +27,13 @@ def with_activation_literals(clause_consumer: ClauseConsumer, activation_literal
     class CCWithActivationLiterals(ClauseConsumer):
         def __init__(self, decorated_clause_consumer, activation_literals):
             self._clause_consumer = decorated_clause_consumer
-            self._activation_literals = tuple(activation_literals)
+            self._activation_literals = list(dict.fromkeys(activation_literals))
+            self._activation_literal_set = frozenset(self._activation_literals)
 
         def consume_clause(self, clause):
-            clause = itertools.chain.from_iterable((self._activation_literals, clause))
-            self._clause_consumer.consume_clause(sorted(set(clause)))
+            activation_literal_set = self._activation_literal_set
+            decorated_clause = self._activation_literals + [lit for lit in clause
+                                                            if lit not in activation_literal_set]
+            self._clause_consumer.consume_clause(decorated_clause)
 
     return CCWithActivationLiterals(clause_consumer, activation_literals)
@@ -1,10 +1,23 @@
 import abc
-from typing import Tuple, Iterable, Union
+from typing import Tuple, Iterable, Union, List
 import cscl_examples.smt_qfbv_solver.sorts as sorts
 
 
+# The child node sequence of AST nodes without children:
+_NO_CHILD_NODES = ()
+
+
 class ASTNode(abc.ABC):
-    """Base class for SMTLib2-language AST nodes."""
+    """
+    Base class for SMTLib2-language AST nodes.
+
+    Since ASTs of large problems consist of many nodes, AST node classes declare their
+    attributes via __slots__.
+    """
+    __slots__ = ()
+
+    # True iff nodes of this class never have child nodes.
+    is_leaf = False
 
     @abc.abstractmethod
     def get_child_nodes(self):
@@ -33,10 +46,13 @@ class ASTNode(abc.ABC):
         :param indent: The current indentation level. By default, this value is 0.
         :return: A string representing the AST tree rooted at this node.
         """
-        result = ((" " * indent) + str(self))
-        for x in self.get_child_nodes():
-            result += "\n" + x.tree_to_string(indent+2)
-        return result
+        lines = []
+        stack = [(self, indent)]
+        while len(stack) != 0:
+            node, node_indent = stack.pop()
+            lines.append((" " * node_indent) + str(node))
+            stack.extend((x, node_indent+2) for x in reversed(node.get_child_nodes()))
+        return "\n".join(lines)
 
 
 class FunctionSignature:
@@ -52,6 +68,8 @@ class FunctionSignature:
                                               For Sort objects s1, ..., sN, domain_sorts_to_range_sort_fn((s1, ..., sN))
                                               returns the function's range sort for parameter sorts s1, ..., sN;
                                               If s1, ..., sN is not part of the function's domain, None is returned.
+                                              The results of this function are cached, so it must return the same
+                                              result when queried again with the same (i.e. identical) sorts.
         :param arity: The function's arity.
         :param is_shadowable: True iff the function may be shadowed and may shadow other functions; False otherwise.
         :param num_parameters: The non-negative number of the function's parameters. If the function is not
@@ -61,6 +79,9 @@ class FunctionSignature:
         self.__arity = arity
         self.__is_shadowable = is_shadowable
         self.__num_parameters = num_parameters
+        # Maps tuples of domain sorts to range sorts. Since sorts are obtained from a caching SortContext,
+        # equal sorts are identical objects, and identity-based hashing of sorts suffices:
+        self.__range_sort_cache = dict()
 
     def get_range_sort(self, domain_sorts):
         """
@@ -69,7 +90,13 @@ class FunctionSignature:
         :param domain_sorts: The query's domain sorts.
         :return: The corresponding range sort, or None domain_sorts is not part of the function's domain.
         """
-        return self.__dtr_fun(domain_sorts)
+        domain_sorts = tuple(domain_sorts)
+        try:
+            return self.__range_sort_cache[domain_sorts]
+        except KeyError:
+            range_sort = self.__dtr_fun(domain_sorts)
+            self.__range_sort_cache[domain_sorts] = range_sort
+            return range_sort
 
     def get_arity(self):
         """
@@ -164,13 +191,26 @@ class FunctionDeclaration:
         return self.__decl_node
 
 
+class _LeafASTNode(ASTNode, abc.ABC):
+    """Base class for AST nodes without child nodes."""
+    __slots__ = ()
+    is_leaf = True
+
+    def get_child_nodes(self):
+        return _NO_CHILD_NODES
+
+    def set_child_node(self, index: int, node: ASTNode):
+        raise ValueError("index " + str(index) + " out of bounds")
+
+
 class CommandASTNode(ASTNode, abc.ABC):
     """Base class for Command AST nodes."""
-    pass
+    __slots__ = ()
 
 
 class TermASTNode(ASTNode, abc.ABC):
     """Base class for term AST nodes."""
+    __slots__ = ()
 
     @abc.abstractmethod
     def get_sort(self) -> sorts.Sort:
@@ -201,6 +241,8 @@ class TermASTNode(ASTNode, abc.ABC):
 
 class AssertCommandASTNode(ASTNode):
     """AST node class for the assert command."""
+    __slots__ = ('__child_nodes',)
+
     def __init__(self, asserted_term):
         self.__child_nodes = (asserted_term,)
 
@@ -216,8 +258,9 @@ class AssertCommandASTNode(ASTNode):
         return self.__class__.__name__
 
 
-class PushPopCommandASTNode(ASTNode):
+class PushPopCommandASTNode(_LeafASTNode):
     """AST node class for the push and pop commands."""
+    __slots__ = ('__is_push', '__num_levels')
 
     def __init__(self, is_push: bool, num_levels: int):
         """
@@ -229,12 +272,6 @@ class PushPopCommandASTNode(ASTNode):
         self.__is_push = is_push
         self.__num_levels = num_levels
 
-    def get_child_nodes(self):
-        return tuple()
-
-    def set_child_node(self, index: int, node: ASTNode):
-        raise ValueError("index " + str(index) + " out of bounds")
-
     def get_num_levels(self):
         """
         Returns the argument to the push/pop command.
@@ -252,29 +289,25 @@ class PushPopCommandASTNode(ASTNode):
         return self.__is_push
 
     def __str__(self):
-        return self.__class__.__name__ + " " + ("Push" if self.__is_push else "Pop") + " " + str(self.__num_levels)
+        return f"{self.__class__.__name__} {'Push' if self.__is_push else 'Pop'} {self.__num_levels}"
 
 
-class CheckSATCommandASTNode(ASTNode):
+class CheckSATCommandASTNode(_LeafASTNode):
     """AST node class for the check-sat command."""
-
-    def get_child_nodes(self):
-        return tuple()
-
-    def set_child_node(self, index: int, node: ASTNode):
-        raise ValueError("index " + str(index) + " out of bounds")
+    __slots__ = ()
 
     def __str__(self):
         return self.__class__.__name__
 
 
-class DeclareFunCommandASTNode(ASTNode):
+class DeclareFunCommandASTNode(_LeafASTNode):
     """
     AST node class for the declare-fun command.
 
     Note that there is no AST node class dedicated to constant declarations, since
     constants are 0-ary functions.
     """
+    __slots__ = ('__fun_name', '__domain_sorts', '__range_sort')
 
     def __init__(self, fun_name, domain_sorts, range_sort):
         """
@@ -313,18 +346,10 @@ class DeclareFunCommandASTNode(ASTNode):
         """
         return self.__range_sort
 
-    def get_child_nodes(self):
-        return tuple()
-
-    def set_child_node(self, index: int, node: ASTNode):
-        raise ValueError("index " + str(index) + " out of bounds")
-
     def __str__(self):
         sorts_as_str = [str(sort) for sort in self.__domain_sorts]
-
-        return self.__class__.__name__ + " FunctionName: " + self.__fun_name \
-            + " DomainSorts: " + str(sorts_as_str) \
-            + " RangeSort: " + str(self.__range_sort)
+        return f"{self.__class__.__name__} FunctionName: {self.__fun_name} DomainSorts: {sorts_as_str} " \
+               f"RangeSort: {self.__range_sort}"
 
 
 class DefineFunCommandASTNode(ASTNode):
@@ -334,6 +359,7 @@ class DefineFunCommandASTNode(ASTNode):
     Note that there is no AST node class dedicated to constant declarations, since
     constants are 0-ary functions.
     """
+    __slots__ = ('__fun_name', '__formal_parameters', '__formal_parameter_names', '__range_sort', '__child_nodes')
 
     def __init__(self, fun_name: str, formal_parameters: Iterable[Tuple[str, sorts.Sort]],
                  range_sort: sorts.Sort, defining_term: TermASTNode):
@@ -349,8 +375,9 @@ class DefineFunCommandASTNode(ASTNode):
         """
         self.__fun_name = fun_name
         self.__formal_parameters = tuple(formal_parameters)
+        self.__formal_parameter_names = tuple(x for x, _ in self.__formal_parameters)
         self.__range_sort = range_sort
-        self.__defining_term = defining_term
+        self.__child_nodes = (defining_term,)
 
     def get_fun_name(self) -> str:
         """
@@ -370,6 +397,14 @@ class DefineFunCommandASTNode(ASTNode):
         """
         return self.__formal_parameters
 
+    def get_formal_parameter_names(self) -> Tuple[str, ...]:
+        """
+        Returns the sequence of the function's formal parameter symbols.
+
+        :return: the sequence of the function's formal parameter symbols, in the order of the formal parameters.
+        """
+        return self.__formal_parameter_names
+
     def get_range_sort(self) -> sorts.Sort:
         """
         Returns the function's range sort.
@@ -379,23 +414,22 @@ class DefineFunCommandASTNode(ASTNode):
         return self.__range_sort
 
     def get_child_nodes(self) -> Iterable[ASTNode]:
-        return self.__defining_term,
+        return self.__child_nodes
 
     def set_child_node(self, index: int, node: ASTNode):
         if index != 0:
             raise ValueError("index " + str(index) + " out of bounds")
-        self.__defining_term = node
+        self.__child_nodes = (node,)
 
     def __str__(self):
-        parms_as_str = ["(" + parmName + ", " + str(parmType) + ")" for parmName, parmType in self.__formal_parameters]
-
-        return self.__class__.__name__ + " FunctionName: " + self.__fun_name \
-            + " FormalParameters: " + str(parms_as_str) \
-            + " RangeSort: " + str(self.__range_sort)
+        parms_as_str = [f"({parmName}, {parmType})" for parmName, parmType in self.__formal_parameters]
+        return f"{self.__class__.__name__} FunctionName: {self.__fun_name} FormalParameters: {parms_as_str} " \
+               f"RangeSort: {self.__range_sort}"
 
 
-class SetLogicCommandASTNode(ASTNode):
+class SetLogicCommandASTNode(_LeafASTNode):
     """AST node class for the set-logic command."""
+    __slots__ = ('__logic_name',)
 
     def __init__(self, logic_name):
         """
@@ -405,12 +439,6 @@ class SetLogicCommandASTNode(ASTNode):
         """
         self.__logic_name = logic_name
 
-    def get_child_nodes(self):
-        return tuple()
-
-    def set_child_node(self, index: int, node: ASTNode):
-        raise ValueError("index " + str(index) + " out of bounds")
-
     def get_logic_name(self):
         """
         Returns the SMT theory passed to set-logic command.
@@ -420,11 +448,12 @@ class SetLogicCommandASTNode(ASTNode):
         return self.__logic_name
 
     def __str__(self):
-        return self.__class__.__name__ + " Logic: " + self.__logic_name
+        return f"{self.__class__.__name__} Logic: {self.__logic_name}"
 
 
-class LiteralASTNode(TermASTNode):
+class LiteralASTNode(_LeafASTNode, TermASTNode):
     """AST node class for literal values."""
+    __slots__ = ('__sort', '__literal')
 
     def __init__(self, literal, sort):
         """
@@ -439,12 +468,6 @@ class LiteralASTNode(TermASTNode):
     def get_sort(self):
         return self.__sort
 
-    def get_child_nodes(self):
-        return tuple()
-
-    def set_child_node(self, index: int, node: ASTNode):
-        raise ValueError("index " + str(index) + " out of bounds")
-
     def get_literal(self):
         """
         Returns the literal.
@@ -457,11 +480,12 @@ class LiteralASTNode(TermASTNode):
         return LiteralASTNode(self.__literal, self.__sort)
 
     def __str__(self):
-        return self.__class__.__name__ + " Literal: " + str(self.__literal) + " Sort: " + str(self.__sort)
+        return f"{self.__class__.__name__} Literal: {self.__literal} Sort: {self.__sort}"
 
 
 class LetTermASTNode(TermASTNode):
     """AST node class for let terms"""
+    __slots__ = ('__symbols', '__defining_terms', '__enclosed_term', '__child_nodes', '__sort')
 
     def __init__(self, pairs_of_symbols_and_defining_terms, enclosed_term: TermASTNode):
         """
@@ -472,23 +496,41 @@ class LetTermASTNode(TermASTNode):
         :param enclosed_term: the term defining the value of the let statement.
         """
 
-        self.__pairs_of_symbols_and_defining_terms = pairs_of_symbols_and_defining_terms
+        # The symbols and their defining terms are stored separately, since only the defining terms
+        # are child nodes of the let term:
+        self.__init_attributes(tuple(x for x, _ in pairs_of_symbols_and_defining_terms),
+                               [y for _, y in pairs_of_symbols_and_defining_terms],
+                               enclosed_term)
+
+    def __init_attributes(self, symbols: Tuple[str, ...], defining_terms: List[TermASTNode],
+                          enclosed_term: TermASTNode):
+        self.__symbols = symbols
+        self.__defining_terms = defining_terms
         self.__enclosed_term = enclosed_term
+        # Cache for get_child_nodes(), invalidated when a child node is replaced:
+        self.__child_nodes = None
+        # Cache for get_sort(), invalidated when the enclosed term is replaced:
+        self.__sort = None
 
     def get_child_nodes(self):
-        return [x[1] for x in self.__pairs_of_symbols_and_defining_terms] + [self.__enclosed_term]
+        if self.__child_nodes is None:
+            self.__child_nodes = (*self.__defining_terms, self.__enclosed_term)
+        return self.__child_nodes
 
     def set_child_node(self, index: int, node: ASTNode):
-        if index < 0 or index > len(self.__pairs_of_symbols_and_defining_terms):
+        if index < 0 or index > len(self.__defining_terms):
             raise ValueError("index " + str(index) + " out of bounds")
-        if index < len(self.__pairs_of_symbols_and_defining_terms):
-            sym, _ = self.__pairs_of_symbols_and_defining_terms[index]
-            self.__pairs_of_symbols_and_defining_terms[index] = (sym, node)
+        self.__child_nodes = None
+        if index < len(self.__defining_terms):
+            self.__defining_terms[index] = node
         else:
             self.__enclosed_term = node
+            self.__sort = None
 
     def get_sort(self):
-        return self.__enclosed_term.get_sort()
+        if self.__sort is None:
+            self.__sort = self.__enclosed_term.get_sort()
+        return self.__sort
 
     def get_enclosed_term(self):
         """
@@ -503,9 +545,9 @@ class LetTermASTNode(TermASTNode):
         Returns a sequence of pairs (x,y) with x being a constant name and y being the
         term defining the constant named by x.
 
-        :return: a sequence of pairs (x,y) as described above.
+        :return: a new list of pairs (x,y) as described above.
         """
-        return self.__pairs_of_symbols_and_defining_terms
+        return list(zip(self.__symbols, self.__defining_terms))
 
     def set_enclosed_term(self, enclosed_term: ASTNode):
         """
@@ -514,29 +556,32 @@ class LetTermASTNode(TermASTNode):
         :return: None
         """
         self.__enclosed_term = enclosed_term
+        self.__child_nodes = None
+        self.__sort = None
 
     def clone(self, decl_ast_node_substitution_map, decl_clone_memoization):
-        assert self not in decl_ast_node_substitution_map.keys()
+        assert self not in decl_ast_node_substitution_map
 
-        replacing_let_term_node = LetTermASTNode(self.__pairs_of_symbols_and_defining_terms,
-                                                 self.__enclosed_term)
+        # The clone needs to be registered as the substitute of this node before cloning the child nodes,
+        # since references to the let-bound symbols need to be redirected to the clone. Its attributes
+        # are initialized once the child nodes have been cloned.
+        replacing_let_term_node = LetTermASTNode.__new__(LetTermASTNode)
         decl_ast_node_substitution_map[self] = replacing_let_term_node
 
-        def_clones = [(name, term.clone(decl_ast_node_substitution_map, decl_clone_memoization))
-                      for name, term in self.__pairs_of_symbols_and_defining_terms]
+        def_clones = [term.clone(decl_ast_node_substitution_map, decl_clone_memoization)
+                      for term in self.__defining_terms]
         enclosed_term_clone = self.__enclosed_term.clone(decl_ast_node_substitution_map, decl_clone_memoization)
 
-        replacing_let_term_node.__pairs_of_symbols_and_defining_terms = def_clones
-        replacing_let_term_node.__enclosed_term = enclosed_term_clone
-
+        replacing_let_term_node.__init_attributes(self.__symbols, def_clones, enclosed_term_clone)
         return replacing_let_term_node
 
     def __str__(self):
-        return self.__class__.__name__ + " Symbols: " + str([x[0] for x in self.__pairs_of_symbols_and_defining_terms])
+        return f"{self.__class__.__name__} Symbols: {list(self.__symbols)}"
 
 
 class FunctionApplicationASTNode(TermASTNode):
     """AST node class for terms representing a function application."""
+    __slots__ = ('__sort', '__argument_nodes', '__parameters', '__declaration')
 
     def __init__(self, declaration: FunctionDeclaration, argument_nodes, parameters: Tuple[int] = tuple()):
         """
@@ -553,12 +598,12 @@ class FunctionApplicationASTNode(TermASTNode):
         if len(argument_nodes) != declaration.get_signature().get_arity():
             raise ValueError("Illegal number of arguments for function " + declaration.get_name())
 
-        arg_sorts = list(parameters) + [x.get_sort() for x in argument_nodes]
+        arg_sorts = (*parameters, *[x.get_sort() for x in argument_nodes])
         self.__sort = declaration.get_signature().get_range_sort(arg_sorts)
         if self.__sort is None:
             raise ValueError("Illegally typed arguments for function " + declaration.get_name())
 
-        self.__argument_nodes = argument_nodes
+        self.__argument_nodes = list(argument_nodes)
         self.__parameters = parameters
         self.__declaration = declaration
 
@@ -566,7 +611,9 @@ class FunctionApplicationASTNode(TermASTNode):
         return self.__sort
 
     def get_child_nodes(self):
-        return tuple(self.__argument_nodes)
+        # The argument list is returned without copying it. It must not be modified by callers,
+        # except via set_child_node().
+        return self.__argument_nodes
 
     def set_child_node(self, index: int, node: ASTNode):
         if index < 0 or index >= len(self.__argument_nodes):
@@ -600,7 +647,7 @@ class FunctionApplicationASTNode(TermASTNode):
         if len(self.__argument_nodes) != declaration.get_signature().get_arity():
             raise ValueError("Illegal number of arguments for function " + declaration.get_name())
 
-        arg_sorts = list(self.__parameters) + [x.get_sort() for x in self.__argument_nodes]
+        arg_sorts = (*self.__parameters, *[x.get_sort() for x in self.__argument_nodes])
         new_sort = declaration.get_signature().get_range_sort(arg_sorts)
         if new_sort is None:
             raise ValueError("Illegally typed arguments for function " + declaration.get_name())
@@ -613,20 +660,20 @@ class FunctionApplicationASTNode(TermASTNode):
                                 for x in self.__argument_nodes]
         parameters_clone = tuple(self.__parameters)
 
-        if self.__declaration in decl_clone_memoization.keys():
-            clone_decl = decl_clone_memoization[self.__declaration]
-        elif self.__declaration.get_declaring_ast_node() in decl_ast_node_substitution_map.keys():
-            new_declaring_node = decl_ast_node_substitution_map[self.__declaration.get_declaring_ast_node()]
-            clone_decl = FunctionDeclaration(self.__declaration.get_name(),
-                                             self.__declaration.get_signature(),
-                                             new_declaring_node)
-            decl_clone_memoization[self.__declaration] = clone_decl
-        else:
-            clone_decl = self.__declaration
+        clone_decl = decl_clone_memoization.get(self.__declaration)
+        if clone_decl is None:
+            new_declaring_node = decl_ast_node_substitution_map.get(self.__declaration.get_declaring_ast_node())
+            if new_declaring_node is not None:
+                clone_decl = FunctionDeclaration(self.__declaration.get_name(),
+                                                 self.__declaration.get_signature(),
+                                                 new_declaring_node)
+                decl_clone_memoization[self.__declaration] = clone_decl
+            else:
+                clone_decl = self.__declaration
         return FunctionApplicationASTNode(clone_decl, argument_node_clones, parameters_clone)
 
     def __str__(self):
-        result = self.__class__.__name__ + " Function: " + self.__declaration.get_name() + " Sort: " + str(self.__sort)
         if len(self.__parameters) != 0:
-            result += " Parameters: " + str(self.__parameters)
-        return result
+            return f"{self.__class__.__name__} Function: {self.__declaration.get_name()} Sort: {self.__sort} " \
+                   f"Parameters: {self.__parameters}"
+        return f"{self.__class__.__name__} Function: {self.__declaration.get_name()} Sort: {self.__sort}"
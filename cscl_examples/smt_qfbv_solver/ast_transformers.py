@@ -31,7 +31,7 @@ class FunctionDefinitionInliner(ASTTransformer):
         :return: The result of expanding term wrt. definition.
         """
         assert term.get_declaration().get_name() == definition.get_fun_name()
-        parm_names = [x for x, _ in definition.get_formal_parameters()]
+        parm_names = definition.get_formal_parameter_names()
         defining_term = definition.get_child_nodes()[0]
         if len(parm_names) > 0:
             arg_terms = term.get_child_nodes()
@@ -44,6 +44,23 @@ class FunctionDefinitionInliner(ASTTransformer):
         else:
             return defining_term.clone(dict(), dict())
 
+    def __expand_term(self, term: ast.TermASTNode) -> ast.TermASTNode:
+        """
+        Expands the given term if it is an application of a function having a definition via define-fun.
+        The term's child nodes are not transformed.
+
+        :param term: The term to be expanded.
+        :return: The expansion of term if term is an application of a function defined via define-fun;
+                 term otherwise.
+        """
+        # The AST node class hierarchy is closed and its classes derive from abc.ABC, for which isinstance()
+        # checks failing on the exact type are expensive. Thus, the node types are compared directly:
+        if type(term) is ast.FunctionApplicationASTNode:
+            declaring_node = term.get_declaration().get_declaring_ast_node()
+            if type(declaring_node) is ast.DefineFunCommandASTNode:
+                return self.__create_expansion(term, declaring_node)
+        return term
+
     def __transform_term(self, term: ast.TermASTNode) -> ast.TermASTNode:
         """
         Destructively expands all function symbols occurring in the given term that have
@@ -53,17 +70,21 @@ class FunctionDefinitionInliner(ASTTransformer):
         :return: The transformed term.
         """
         # TODO: expansion cycle detection
-        if isinstance(term, ast.FunctionApplicationASTNode) \
-           and isinstance(term.get_declaration().get_declaring_ast_node(), ast.DefineFunCommandASTNode):
-            definition = term.get_declaration().get_declaring_ast_node()
-            result = self.__create_expansion(term, definition)
-        else:
-            result = term
 
-        # Transform child nodes.
-        children = result.get_child_nodes()
-        for i, child_node in enumerate(children):
-            result.set_child_node(i, self.__transform_term(child_node))
+        # The term is traversed iteratively to avoid exceeding Python's recursion limit for deeply
+        # nested terms. Each node on the stack has already been expanded, but its child nodes have not.
+        # Leaf nodes are not put on the stack, since they have no child nodes to be transformed.
+        result = self.__expand_term(term)
+        stack = [] if result.is_leaf else [result]
+        expand_term = self.__expand_term
+        while len(stack) != 0:
+            node = stack.pop()
+            for i, child_node in enumerate(node.get_child_nodes()):
+                expanded_child_node = expand_term(child_node)
+                if expanded_child_node is not child_node:
+                    node.set_child_node(i, expanded_child_node)
+                if not expanded_child_node.is_leaf:
+                    stack.append(expanded_child_node)
 
         return result
 
@@ -75,6 +96,6 @@ class FunctionDefinitionInliner(ASTTransformer):
         :return: The transformed AST, as a list of AST nodes.
         """
         for node in ast_nodes:
-            if isinstance(node, ast.AssertCommandASTNode):
+            if type(node) is ast.AssertCommandASTNode:
                 node.set_child_node(0, self.__transform_term(node.get_child_nodes()[0]))
-        return [x for x in ast_nodes if not isinstance(x, ast.DefineFunCommandASTNode)]
+        return [x for x in ast_nodes if type(x) is not ast.DefineFunCommandASTNode]
@@ -1,3 +1,6 @@
+import sys
+
+
 def lex_sexp(sexp_string: str):
     """
     Tokenizes an s-expression string not containing comments.
@@ -27,7 +30,9 @@ def lex_sexp(sexp_string: str):
                     and sexp_string[cursor_ahead] != '(' \
                     and sexp_string[cursor_ahead] != ')':
                 cursor_ahead += 1
-            yield sexp_string[cursor:cursor_ahead]
+            # Tokens are interned since the same symbols occur many times in typical problems. This saves memory
+            # and lets comparisons and dictionary lookups of equal tokens succeed on the identity check:
+            yield sys.intern(sexp_string[cursor:cursor_ahead])
             cursor = cursor_ahead
 
 
@@ -7,6 +7,22 @@ from cscl_examples.smt_qfbv_solver.syntactic_scope import SyntacticFunctionScope
 from cscl_examples.smt_qfbv_solver.ast import FunctionSignature, FunctionDeclaration
 
 
+binary_literal_body_regex = re.compile("[01]+")
+numeral_regex = re.compile("[0-9]+")
+
+
+def _is_numeral(sexp) -> bool:
+    """
+    Determines whether the given s-expression is a string consisting only of the decimal digits 0-9.
+
+    Unlike str.isnumeric(), this function does not accept other Unicode numeric characters such as "²".
+
+    :param sexp: An s-expression.
+    :return: True iff sexp is a non-empty string consisting only of the characters 0-9.
+    """
+    return isinstance(sexp, str) and numeral_regex.fullmatch(sexp) is not None
+
+
 def parse_smtlib2_literal(lit_string: str, sort_ctx: sorts.SortContext) -> Union[ast.LiteralASTNode, type(None)]:
     """
     Parses an SMTLib2-format literal.
@@ -22,17 +38,15 @@ def parse_smtlib2_literal(lit_string: str, sort_ctx: sorts.SortContext) -> Union
     if '.' in lit_string:
         raise ValueError("Decimals are not supported")
 
-    if lit_string.isnumeric():
+    if _is_numeral(lit_string):
         if lit_string.startswith("00"):
             raise ValueError("Illegal extra leading 0 in integer literal")
         return ast.LiteralASTNode(int(lit_string), sort_ctx.get_int_sort())
     elif lit_string.startswith("#b"):
-        lit_value = 0
-        exp = 0
-        for i in reversed(range(2, len(lit_string))):
-            lit_value |= (1 << exp) if lit_string[i] == '1' else 0
-            exp += 1
-        return ast.LiteralASTNode(lit_value, sort_ctx.get_bv_sort(len(lit_string)-2))
+        lit_body = lit_string[2:]
+        if not binary_literal_body_regex.fullmatch(lit_body):
+            raise ValueError("Malformed binary literal " + lit_string)
+        return ast.LiteralASTNode(int(lit_body, 2), sort_ctx.get_bv_sort(len(lit_body)))
     elif lit_string.startswith("\""):
         # not supported
         raise ValueError("String literals are not supported")
@@ -52,34 +66,63 @@ def parse_smtlib2_sort(parsed_sexp, sort_ctx: sorts.SortContext):
         return sort_ctx.get_int_sort()
     elif parsed_sexp == "Bool":
         return sort_ctx.get_bool_sort()
-    elif len(parsed_sexp) == 3 and parsed_sexp[0:2] == ["_", "BitVec"]:
+    elif len(parsed_sexp) == 3 and parsed_sexp[0] == "_" and parsed_sexp[1] == "BitVec":
         length_str = parsed_sexp[2]
-        if not length_str.isnumeric() or '.' in length_str:
+        if not _is_numeral(length_str):
             raise ValueError("Illegal BitVec type length in " + str(parsed_sexp))
         return sort_ctx.get_bv_sort(int(length_str))
     raise ValueError("Unsupported sort " + str(parsed_sexp))
 
 
-simple_symbol_regex = re.compile("[a-zA-Z~!@$%^&*+=<>.?/-][0-9a-zA-Z~!@$%^&*+=<>.?/-]*")
-reserved_words = ("let", "par", "_", "!", "as", "forall", "exists", "NUMERAL", "DECIMAL", "STRING",
-                  "set-logic", "assert", "declare-fun", "declare-const", "define-fun", "define-const",
-                  "check-sat", "push", "pop", "get-model", "get-unsat-core", "set-info", "get-info",
-                  "declare-sort", "define-sort", "get-assertions", "get-proof", "get-value", "get-assignment",
-                  "get-option", "set-option", "exit")
+simple_symbol_regex = re.compile("[a-zA-Z~!@$%^&*_+=<>.?/-][0-9a-zA-Z~!@$%^&*_+=<>.?/-]*")
+reserved_words = frozenset(("let", "par", "_", "!", "as", "forall", "exists", "NUMERAL", "DECIMAL", "STRING",
+                            "set-logic", "assert", "declare-fun", "declare-const", "define-fun", "define-const",
+                            "check-sat", "push", "pop", "get-model", "get-unsat-core", "set-info", "get-info",
+                            "declare-sort", "define-sort", "get-assertions", "get-proof", "get-value", "get-assignment",
+                            "get-option", "set-option", "exit"))
 
 
 def parse_smtlib2_symbol(symbol: str) -> str:
     if len(symbol) >= 2 and symbol[0] == '|' and symbol[len(symbol)-1] == '|':
         raise ValueError("Error parsing symbol " + symbol + ": quoted symbols not supported yet")
     else:
-        if ' ' not in symbol\
-                and symbol not in reserved_words\
-                and simple_symbol_regex.match(symbol):
+        if simple_symbol_regex.fullmatch(symbol) and symbol not in reserved_words:
             return symbol
         else:
             raise ValueError("Illegal symbol " + symbol)
 
 
+class _FixedSignatureFn:
+    """
+    Signature function of non-overloaded functions, i.e. of functions having exactly one domain.
+    """
+    __slots__ = ("__domain_sorts", "__range_sort")
+
+    def __init__(self, domain_sorts, range_sort):
+        """
+        Initializes the _FixedSignatureFn object.
+
+        :param domain_sorts: The function's domain sorts.
+        :param range_sort: The function's range sort.
+        """
+        self.__domain_sorts = tuple(domain_sorts)
+        self.__range_sort = range_sort
+
+    def __call__(self, domain_sorts):
+        # Since sorts are unique within their sort context, comparing the tuples boils down to identity checks:
+        return self.__range_sort if tuple(domain_sorts) == self.__domain_sorts else None
+
+
+def _make_constant_signature(sort):
+    """
+    Creates the signature of a shadowable constant, e.g. of a let-bound variable.
+
+    :param sort: The constant's sort.
+    :return: The signature of a shadowable nullary function with range sort `sort`.
+    """
+    return FunctionSignature(_FixedSignatureFn((), sort), 0, True)
+
+
 def parse_smtlib2_flat_term(parsed_sexp, sort_ctx: sorts.SortContext,
                             fun_scope: SyntacticFunctionScope) -> ast.TermASTNode:
     """
@@ -103,15 +146,19 @@ def parse_smtlib2_flat_term(parsed_sexp, sort_ctx: sorts.SortContext,
             return ast.FunctionApplicationASTNode(constant_decl, tuple())
 
 
-def parse_smtlib2_func_application_term(parsed_sexp, sort_ctx: sorts.SortContext,
-                                        fun_scope: SyntacticFunctionScope) -> ast.TermASTNode:
+def _iter_parse_func_application_term(parsed_sexp, sort_ctx: sorts.SortContext,
+                                      fun_scope: SyntacticFunctionScope):
     """
-    Parses an STMLib2-formatted term that is given as a list and is not a let term.
+    Creates a generator parsing an STMLib2-formatted term that is given as a list and is not a let term.
+
+    The generator does not parse the term's subterms itself. Instead, it yields a tuple (x, y) for each subterm, with
+    x being the subterm's s-expression and y being the function scope in which the subterm needs to be parsed. The
+    parsed subterm needs to be passed to the generator via its send() method.
 
     :param parsed_sexp: The term's s-expression.
     :param sort_ctx: The current sort context.
     :param fun_scope: The current function scope.
-    :return: A FunctionApplicationASTNode representing parsed_sexp.
+    :return: A generator returning a FunctionApplicationASTNode representing parsed_sexp.
     :raises ValueError if parsed_sexp is a malformed term.
     """
     if len(parsed_sexp) == 0:
@@ -119,34 +166,40 @@ def parse_smtlib2_func_application_term(parsed_sexp, sort_ctx: sorts.SortContext
 
     if isinstance(parsed_sexp[0], list):
         param_fn_sexp = parsed_sexp[0]
+        fparams_sexp = param_fn_sexp[2:]
         if len(param_fn_sexp) < 2\
                 or param_fn_sexp[0] != "_"\
-                or not all(x.isnumeric() for x in param_fn_sexp[2:]):
+                or not all(map(_is_numeral, fparams_sexp)):
             raise ValueError("Malformed parametrized function expression " + str(param_fn_sexp))
         fname = SyntacticFunctionScope.mangle_parametrized_function_name(param_fn_sexp[1])
-        fparams = tuple(int(x) for x in param_fn_sexp[2:])
+        fparams = tuple(map(int, fparams_sexp))
     else:
         fname = parsed_sexp[0]
         fparams = tuple()
 
-    if fun_scope.get_declaration(fname) is None:
+    fun_decl = fun_scope.get_declaration(fname)
+    if fun_decl is None:
         raise ValueError("Undeclared function " + fname)
 
-    args = [parse_smtlib2_term(x, sort_ctx, fun_scope) for x in parsed_sexp[1:]]
+    args = []
+    for x in parsed_sexp[1:]:
+        args.append((yield x, fun_scope))
 
     # FunctionApplicationASTNode raises ValueError if the term is not well-sorted:
-    return ast.FunctionApplicationASTNode(fun_scope.get_declaration(fname), args, fparams)
+    return ast.FunctionApplicationASTNode(fun_decl, args, fparams)
 
 
-def parse_smtlib2_let_term(parsed_sexp, sort_ctx: sorts.SortContext,
-                           fun_scope: SyntacticFunctionScope) -> ast.LetTermASTNode:
+def _iter_parse_let_term(parsed_sexp, sort_ctx: sorts.SortContext, fun_scope: SyntacticFunctionScope):
     """
-    Parses an SMTLib2-formatted let term.
+    Creates a generator parsing an SMTLib2-formatted let term.
+
+    The generator requests its subterms to be parsed like the generators created by
+    _iter_parse_func_application_term().
 
     :param parsed_sexp: The term's s-expression.
     :param sort_ctx: The current sort context.
     :param fun_scope: The current function scope.
-    :return: A LetTermASTNode representing parsed_sexp.
+    :return: A generator returning a LetTermASTNode representing parsed_sexp.
     :raises ValueError if parsed_sexp is a malformed term.
     """
     if len(parsed_sexp) != 3 or not isinstance(parsed_sexp[1], list):
@@ -158,23 +211,101 @@ def parse_smtlib2_let_term(parsed_sexp, sort_ctx: sorts.SortContext,
     var_decls = []
     for (x, y) in parsed_sexp[1]:
         name = parse_smtlib2_symbol(x)
-        defining_term = parse_smtlib2_term(y, sort_ctx, fun_scope)
+        defining_term = yield y, fun_scope
         const_sort = defining_term.get_sort()
-        const_sig = (lambda const_sort_: FunctionSignature(lambda z: const_sort_ if len(z) == 0 else None,
-                                                           0, True))(const_sort)
-        const_decl = FunctionDeclaration(name, const_sig)
+        const_decl = FunctionDeclaration(name, _make_constant_signature(const_sort))
         fun_scope_extension.add_declaration(const_decl)
         let_defs.append((name, defining_term))
         var_decls.append(const_decl)
 
-    enclosed_term = parse_smtlib2_term(parsed_sexp[2], sort_ctx, fun_scope_extension)
+    enclosed_term = yield parsed_sexp[2], fun_scope_extension
     result = ast.LetTermASTNode(let_defs, enclosed_term)
     for decl in var_decls:
         decl.set_declaring_ast_node(result)
 
+    # Let terms determine their sort lazily, querying their enclosed term. Determine it right away, while the
+    # enclosed term's sort is known, to avoid deep recursion when the sort is first queried for deeply nested lets:
+    result.get_sort()
+
     return result
 
 
+def _iter_parse_term(parsed_sexp, fun_scope: SyntacticFunctionScope):
+    """
+    Creates a generator requesting parsed_sexp to be parsed as a term, returning the resulting term.
+
+    :param parsed_sexp: The term's s-expression.
+    :param fun_scope: The current function scope.
+    :return: A generator returning the TermASTNode representing parsed_sexp.
+    """
+    return (yield parsed_sexp, fun_scope)
+
+
+def _run_term_parser(term_parser, sort_ctx: sorts.SortContext) -> ast.TermASTNode:
+    """
+    Runs a term parser created by one of the _iter_parse_* functions, parsing the requested subterms.
+
+    Since SMTLib2 terms can be deeply nested, the subterms are parsed using an explicit stack of term parsers
+    instead of recursion.
+
+    :param term_parser: The term parser.
+    :param sort_ctx: The current sort context.
+    :return: The term returned by term_parser.
+    :raises ValueError if a malformed term is encountered.
+    """
+    parser_stack = [term_parser]
+    subterm = None
+    while True:
+        try:
+            subterm_sexp, subterm_scope = parser_stack[-1].send(subterm)
+        except StopIteration as parser_result:
+            parser_stack.pop()
+            if len(parser_stack) == 0:
+                return parser_result.value
+            subterm = parser_result.value
+            continue
+
+        subterm = None
+        if not isinstance(subterm_sexp, list):
+            subterm = parse_smtlib2_flat_term(subterm_sexp, sort_ctx, subterm_scope)
+        elif len(subterm_sexp) == 0:
+            raise ValueError("Empty term")
+        elif subterm_sexp[0] == "let":
+            parser_stack.append(_iter_parse_let_term(subterm_sexp, sort_ctx, subterm_scope))
+        elif subterm_sexp[0] == "_":
+            subterm = parse_smtlib2_underscore_bv_literal_term(subterm_sexp, sort_ctx)
+        else:
+            parser_stack.append(_iter_parse_func_application_term(subterm_sexp, sort_ctx, subterm_scope))
+
+
+def parse_smtlib2_func_application_term(parsed_sexp, sort_ctx: sorts.SortContext,
+                                        fun_scope: SyntacticFunctionScope) -> ast.TermASTNode:
+    """
+    Parses an STMLib2-formatted term that is given as a list and is not a let term.
+
+    :param parsed_sexp: The term's s-expression.
+    :param sort_ctx: The current sort context.
+    :param fun_scope: The current function scope.
+    :return: A FunctionApplicationASTNode representing parsed_sexp.
+    :raises ValueError if parsed_sexp is a malformed term.
+    """
+    return _run_term_parser(_iter_parse_func_application_term(parsed_sexp, sort_ctx, fun_scope), sort_ctx)
+
+
+def parse_smtlib2_let_term(parsed_sexp, sort_ctx: sorts.SortContext,
+                           fun_scope: SyntacticFunctionScope) -> ast.LetTermASTNode:
+    """
+    Parses an SMTLib2-formatted let term.
+
+    :param parsed_sexp: The term's s-expression.
+    :param sort_ctx: The current sort context.
+    :param fun_scope: The current function scope.
+    :return: A LetTermASTNode representing parsed_sexp.
+    :raises ValueError if parsed_sexp is a malformed term.
+    """
+    return _run_term_parser(_iter_parse_let_term(parsed_sexp, sort_ctx, fun_scope), sort_ctx)
+
+
 def parse_smtlib2_underscore_bv_literal_term(parsed_sexp, sort_ctx: sorts.SortContext) -> ast.LiteralASTNode:
     """
     Parses an SMTLib2-formatted term matching "(_ bvX y)".
@@ -185,11 +316,12 @@ def parse_smtlib2_underscore_bv_literal_term(parsed_sexp, sort_ctx: sorts.SortCo
     :raises ValueError if parsed_sexp is a malformed term.
     """
 
-    if len(parsed_sexp) != 3 or parsed_sexp[0] != "_" or parsed_sexp[1][0:2] != "bv" or not parsed_sexp[2].isnumeric():
+    if len(parsed_sexp) != 3 or parsed_sexp[0] != "_" or not isinstance(parsed_sexp[1], str)\
+            or not parsed_sexp[1].startswith("bv") or not _is_numeral(parsed_sexp[2]):
         raise ValueError("Malformed literal term " + str(parsed_sexp))
 
     literal_str = parsed_sexp[1][2:]
-    if not literal_str.isnumeric():
+    if not _is_numeral(literal_str):
         raise ValueError("Malformed literal term " + str(parsed_sexp) + ": bad literal value")
 
     return ast.LiteralASTNode(int(literal_str), sort_ctx.get_bv_sort(int(parsed_sexp[2])))
@@ -205,13 +337,7 @@ def parse_smtlib2_term(parsed_sexp, sort_ctx: sorts.SortContext, fun_scope: Synt
     :return: A TermASTNode representing parsed_sexp.
     :raises ValueError if parsed_sexp is a malformed term.
     """
-    if not isinstance(parsed_sexp, list):
-        return parse_smtlib2_flat_term(parsed_sexp, sort_ctx, fun_scope)
-    if parsed_sexp[0] == "let":
-        return parse_smtlib2_let_term(parsed_sexp, sort_ctx, fun_scope)
-    if parsed_sexp[0] == "_":
-        return parse_smtlib2_underscore_bv_literal_term(parsed_sexp, sort_ctx)
-    return parse_smtlib2_func_application_term(parsed_sexp, sort_ctx, fun_scope)
+    return _run_term_parser(_iter_parse_term(parsed_sexp, fun_scope), sort_ctx)
 
 
 def parse_cmd_assert(parsed_sexp, sort_ctx: sorts.SortContext, scope: SyntacticFunctionScope):
@@ -244,15 +370,10 @@ def parse_cmd_declare_fun(parsed_sexp, sort_ctx: sorts.SortContext):
     """
     if len(parsed_sexp) != 4 or not isinstance(parsed_sexp[1], str) or not isinstance(parsed_sexp[2], list):
         raise ValueError("Invalid declare-fun command")
-    fun_name, domain_sorts_sexp, range_sort_sexp = parsed_sexp[1:]
+    fun_name, domain_sorts_sexp, range_sort_sexp = parsed_sexp[1], parsed_sexp[2], parsed_sexp[3]
     domain_sorts = [parse_smtlib2_sort(x, sort_ctx=sort_ctx) for x in domain_sorts_sexp]
     range_sort = parse_smtlib2_sort(range_sort_sexp, sort_ctx=sort_ctx)
-
-    def __signature_fn(concrete_dom_sigs):
-        if list(concrete_dom_sigs) == domain_sorts:
-            return range_sort
-        return None
-    signature = FunctionSignature(__signature_fn, len(domain_sorts), True)
+    signature = FunctionSignature(_FixedSignatureFn(domain_sorts, range_sort), len(domain_sorts), True)
 
     decl_ast_node = ast.DeclareFunCommandASTNode(fun_name, domain_sorts, range_sort)
     return decl_ast_node, FunctionDeclaration(fun_name, signature, decl_ast_node)
@@ -270,14 +391,9 @@ def parse_cmd_declare_const(parsed_sexp, sort_ctx: sorts.SortContext):
     """
     if len(parsed_sexp) != 3 or not isinstance(parsed_sexp[1], str):
         raise ValueError("Invalid declare-const command")
-    fun_name, range_sort_sexp = parsed_sexp[1:]
+    fun_name, range_sort_sexp = parsed_sexp[1], parsed_sexp[2]
     range_sort = parse_smtlib2_sort(range_sort_sexp, sort_ctx=sort_ctx)
-
-    def __signature_fn(concrete_dom_sigs):
-        if len(concrete_dom_sigs) == 0:
-            return range_sort
-        return None
-    signature = FunctionSignature(__signature_fn, 0, True)
+    signature = FunctionSignature(_FixedSignatureFn((), range_sort), 0, True)
 
     decl_ast_node = ast.DeclareFunCommandASTNode(fun_name, [], range_sort)
     return decl_ast_node, FunctionDeclaration(fun_name, signature, decl_ast_node)
@@ -296,7 +412,8 @@ def parse_cmd_define_fun(parsed_sexp, sort_ctx: sorts.SortContext, scope: Syntac
     """
     if len(parsed_sexp) != 5 or not isinstance(parsed_sexp[1], str) or not isinstance(parsed_sexp[2], list):
         raise ValueError("Invalid define-fun command")
-    fun_name, parameters_sexp, range_sort_sexp, defining_term_sexp = parsed_sexp[1:]
+    fun_name, parameters_sexp, range_sort_sexp, defining_term_sexp = \
+        parsed_sexp[1], parsed_sexp[2], parsed_sexp[3], parsed_sexp[4]
 
     function_scope = SyntacticFunctionScope(scope)
     domain_sorts = []
@@ -307,8 +424,7 @@ def parse_cmd_define_fun(parsed_sexp, sort_ctx: sorts.SortContext, scope: Syntac
         parameter_sym_str, parameter_ty_sexp = x
         parameter_sym = parse_smtlib2_symbol(parameter_sym_str)
         parameter_sort = parse_smtlib2_sort(parameter_ty_sexp, sort_ctx)
-        parameter_sig = (lambda s: FunctionSignature(lambda t: s if len(t) == 0 else None, 0, True))(parameter_sort)
-        function_scope.add_declaration(FunctionDeclaration(parameter_sym, parameter_sig))
+        function_scope.add_declaration(FunctionDeclaration(parameter_sym, _make_constant_signature(parameter_sort)))
         domain_sorts.append(parameter_sort)
         formal_parameters.append((parameter_sym, parameter_sort))
 
@@ -318,13 +434,8 @@ def parse_cmd_define_fun(parsed_sexp, sort_ctx: sorts.SortContext, scope: Syntac
     if range_sort is not defining_term.get_sort():
         raise ValueError("Invalid define-fun command: defining term sort does not match function range sort")
 
-    def __signature_fn(concrete_dom_sigs):
-        if list(concrete_dom_sigs) == domain_sorts:
-            return range_sort
-        return None
-
     defn_ast_node = ast.DefineFunCommandASTNode(fun_name, formal_parameters, range_sort, defining_term)
-    signature = FunctionSignature(__signature_fn, len(domain_sorts), True)
+    signature = FunctionSignature(_FixedSignatureFn(domain_sorts, range_sort), len(domain_sorts), True)
 
     return defn_ast_node, FunctionDeclaration(fun_name, signature, defn_ast_node)
 
@@ -371,15 +482,16 @@ def add_logic_as_parent(scope: SyntacticFunctionScope, sort_ctx: sorts.SortConte
         raise ValueError("Unsupported logic " + logic)
 
 
-def parse_smtlib2_problem(parsed_sexp):
+def iter_parse_smtlib2_problem(parsed_sexp):
     """
-    Parses an SMTLib2-formatted SMT problem.
+    Parses an SMTLib2-formatted SMT problem lazily, one command at a time.
 
-    This parser currently only supports a subset of SMTLib2. TODO: document the supported SMTLib2 subset.
+    See parse_smtlib2_problem() for a description of the parser.
 
-    :param parsed_sexp: The command's s-expression.
-    :return: A list of ASTNodes, representing parsed_sexp.
-    :raises ValueError if parsed_sexp is a malformed problem.
+    :param parsed_sexp: The problem's s-expressions, given as an iterable of the commands' s-expressions.
+    :return: An iterator over the ASTNodes representing parsed_sexp.
+    :raises ValueError if parsed_sexp is a malformed problem. The error is raised when the iterator reaches
+                       the malformed command.
     """
 
     sort_context = sorts.SortContext()
@@ -387,81 +499,91 @@ def parse_smtlib2_problem(parsed_sexp):
     problem_toplevel_function_scope = SyntacticFunctionScope(core_theory)
     push_level = 0
 
-    def parse_command(sexp):
-        nonlocal problem_toplevel_function_scope  # Needs to be changed by push and pop commands
-        nonlocal push_level  # Needs to be changed by push and pop commands
+    def add_to_toplevel_scope(ast_node, fun_decl):
+        problem_toplevel_function_scope.add_declaration(fun_decl)
+        return ast_node
 
-        if len(sexp) == 0:
-            raise ValueError("Missing command")
-        command = sexp[0]
-
-        if command == "assert":
-            return parse_cmd_assert(sexp, sort_context, problem_toplevel_function_scope)
-
-        elif command == "check-sat":
-            return ast.CheckSATCommandASTNode()
-
-        elif command == "declare-fun":
-            ast_node, fun_decl = parse_cmd_declare_fun(sexp, sort_context)
-            problem_toplevel_function_scope.add_declaration(fun_decl)
-            return ast_node
-
-        elif command == "declare-const":
-            ast_node, fun_decl = parse_cmd_declare_const(sexp, sort_context)
-            problem_toplevel_function_scope.add_declaration(fun_decl)
-            return ast_node
+    def parse_set_logic(sexp):
+        if len(sexp) != 2 or not isinstance(sexp[1], str):
+            raise ValueError("Invalid set-logic command")
+        logic = sexp[1]
+        add_logic_as_parent(problem_toplevel_function_scope, sort_context, logic)
+        return ast.SetLogicCommandASTNode(logic)
 
-        elif command == "define-fun":
-            ast_node, fun_decl = parse_cmd_define_fun(sexp, sort_context, problem_toplevel_function_scope)
-            problem_toplevel_function_scope.add_declaration(fun_decl)
-            return ast_node
-
-        elif command == "define-const":
-            ast_node, fun_decl = parse_cmd_define_const(sexp, sort_context, problem_toplevel_function_scope)
-            problem_toplevel_function_scope.add_declaration(fun_decl)
-            return ast_node
+    def parse_push(sexp):
+        nonlocal problem_toplevel_function_scope  # Needs to be changed by push and pop commands
+        nonlocal push_level  # Needs to be changed by push and pop commands
 
-        elif command == "set-logic":
-            if len(sexp) != 2 or not isinstance(sexp[1], str):
-                raise ValueError("Invalid set-logic command")
-            logic = sexp[1]
-            add_logic_as_parent(problem_toplevel_function_scope, sort_context, logic)
-            return ast.SetLogicCommandASTNode(logic)
+        if len(sexp) > 2:
+            raise ValueError("Invalid push command")
+        amnt = 1 if len(sexp) == 1 else int(sexp[1])
+        if amnt < 0:
+            raise ValueError("Invalid negative argument for push command")
 
-        elif command == "push":
-            if len(sexp) > 2:
-                raise ValueError("Invalid push command")
-            amnt = 1 if len(sexp) == 1 else int(sexp[1])
-            if amnt < 0:
-                raise ValueError("Invalid negative argument for push command")
+        for _ in range(0, amnt):
+            new_scope = SyntacticFunctionScope(problem_toplevel_function_scope)
+            problem_toplevel_function_scope = new_scope
 
-            for _ in range(0, amnt):
-                new_scope = SyntacticFunctionScope(problem_toplevel_function_scope)
-                problem_toplevel_function_scope = new_scope
+        push_level += amnt
+        return ast.PushPopCommandASTNode(True, amnt)
 
-            push_level += amnt
-            return ast.PushPopCommandASTNode(True, amnt)
+    def parse_pop(sexp):
+        nonlocal problem_toplevel_function_scope  # Needs to be changed by push and pop commands
+        nonlocal push_level  # Needs to be changed by push and pop commands
 
-        elif command == "pop":
-            if len(sexp) > 2:
-                raise ValueError("Invalid pop command")
-            amnt = 1 if len(sexp) == 1 else int(sexp[1])
-            if amnt < 0:
-                raise ValueError("Invalid negative argument for pop command")
+        if len(sexp) > 2:
+            raise ValueError("Invalid pop command")
+        amnt = 1 if len(sexp) == 1 else int(sexp[1])
+        if amnt < 0:
+            raise ValueError("Invalid negative argument for pop command")
+
+        if push_level - amnt < 0:
+            raise ValueError("Invalid pop command: no corresponding push command")
+
+        for _ in range(0, amnt):
+            problem_toplevel_function_scope = problem_toplevel_function_scope.get_parent()
+
+        push_level -= amnt
+        return ast.PushPopCommandASTNode(False, amnt)
+
+    command_parsers = {
+        "assert": lambda sexp: parse_cmd_assert(sexp, sort_context, problem_toplevel_function_scope),
+        "check-sat": lambda sexp: ast.CheckSATCommandASTNode(),
+        "declare-fun": lambda sexp: add_to_toplevel_scope(*parse_cmd_declare_fun(sexp, sort_context)),
+        "declare-const": lambda sexp: add_to_toplevel_scope(*parse_cmd_declare_const(sexp, sort_context)),
+        "define-fun": lambda sexp: add_to_toplevel_scope(*parse_cmd_define_fun(sexp, sort_context,
+                                                                               problem_toplevel_function_scope)),
+        "define-const": lambda sexp: add_to_toplevel_scope(*parse_cmd_define_const(sexp, sort_context,
+                                                                                   problem_toplevel_function_scope)),
+        "set-logic": parse_set_logic,
+        "push": parse_push,
+        "pop": parse_pop,
+        "set-info": lambda sexp: None  # Ignore set-info commands
+    }
 
-            if push_level - amnt < 0:
-                raise ValueError("Invalid pop command: no corresponding push command")
+    def parse_command(sexp):
+        if len(sexp) == 0:
+            raise ValueError("Missing command")
+        command = sexp[0]
+        command_parser = command_parsers.get(command)
+        if command_parser is None:
+            raise ValueError("Unsupported command " + command)
+        return command_parser(sexp)
 
-            for _ in range(0, amnt):
-                problem_toplevel_function_scope = problem_toplevel_function_scope.get_parent()
+    for command_sexp in parsed_sexp:
+        ast_node = parse_command(command_sexp)
+        if ast_node is not None:
+            yield ast_node
 
-            push_level -= amnt
-            return ast.PushPopCommandASTNode(False, amnt)
 
-        elif command == "set-info":
-            pass  # Ignore set-info commands
+def parse_smtlib2_problem(parsed_sexp):
+    """
+    Parses an SMTLib2-formatted SMT problem.
 
-        else:
-            raise ValueError("Unsupported command " + command)
+    This parser currently only supports a subset of SMTLib2. TODO: document the supported SMTLib2 subset.
 
-    return [x for x in (parse_command(x) for x in parsed_sexp) if x is not None]
+    :param parsed_sexp: The command's s-expression.
+    :return: A list of ASTNodes, representing parsed_sexp.
+    :raises ValueError if parsed_sexp is a malformed problem.
+    """
+    return list(iter_parse_smtlib2_problem(parsed_sexp))
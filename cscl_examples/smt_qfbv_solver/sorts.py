@@ -2,18 +2,24 @@ import abc
 
 
 class Sort(abc.ABC):
-    """Base class for representations of sorts. Classes derived from Sort must be immutable."""
-    pass
+    """
+    Base class for representations of sorts. Classes derived from Sort must be immutable. The sort classes must
+    not be subclassed further, since sorts are distinguished via type(sort) is X checks.
+    """
+    __slots__ = ()
 
 
 class BooleanSort(Sort):
     """The Boolean sort."""
+    __slots__ = ()
+
     def __str__(self):
         return "Bool"
 
 
 class BitvectorSort(Sort):
     """The bitvector sort."""
+    __slots__ = ('__len',)
 
     def __init__(self, length: int):
         """
@@ -33,6 +39,8 @@ class BitvectorSort(Sort):
 
 class IntegerSort(Sort):
     """The integer sort."""
+    __slots__ = ()
+
     def __str__(self):
         return "Int"
 
@@ -58,11 +66,11 @@ class SortContext:
         :param length: The length of the bitvector, in bits.
         :return: the Bitvector sort for the specified length.
         """
-        if length in self.__bv_sorts.keys():
-            return self.__bv_sorts[length]
-        new_sort = BitvectorSort(length)
-        self.__bv_sorts[length] = new_sort
-        return new_sort
+        result = self.__bv_sorts.get(length)
+        if result is None:
+            result = BitvectorSort(length)
+            self.__bv_sorts[length] = result
+        return result
 
     def get_bool_sort(self):
         """
@@ -6,6 +6,11 @@ class SyntacticFunctionScope:
     """
     A scope of function declarations.
     """
+    __slots__ = ('__parent', '__decls', '__lookup_cache', '__lookup_cache_generation')
+
+    # Incremented whenever any scope is modified. Since modifying a scope may change the lookup results
+    # of all its descendant scopes, the lookup caches are only valid for the generation they were filled in.
+    __generation = 0
 
     def __init__(self, parent_scope):
         """
@@ -15,6 +20,12 @@ class SyntacticFunctionScope:
         """
         self.__parent = parent_scope
         self.__decls = dict()
+        self.__lookup_cache = dict()
+        self.__lookup_cache_generation = SyntacticFunctionScope.__generation
+
+    @staticmethod
+    def __invalidate_lookup_caches():
+        SyntacticFunctionScope.__generation += 1
 
     def get_declaration(self, func_name: str) -> Union[ast.FunctionDeclaration, type(None)]:
         """
@@ -27,12 +38,21 @@ class SyntacticFunctionScope:
         :return: If the scope has no function with name func_name, None is returned. Otherwise, the function's
                  declaration is returned.
         """
-        if func_name in self.__decls.keys():
-            return self.__decls[func_name]
-        elif self.__parent is not None:
-            return self.__parent.get_declaration(func_name)
-        else:
-            return None
+        if self.__lookup_cache_generation != SyntacticFunctionScope.__generation:
+            self.__lookup_cache.clear()
+            self.__lookup_cache_generation = SyntacticFunctionScope.__generation
+        elif func_name in self.__lookup_cache:
+            return self.__lookup_cache[func_name]
+
+        result = None
+        scope = self
+        while scope is not None:
+            if func_name in scope.__decls:
+                result = scope.__decls[func_name]
+                break
+            scope = scope.__parent
+        self.__lookup_cache[func_name] = result
+        return result
 
     def add_declaration(self, declaration: ast.FunctionDeclaration):
         """
@@ -45,10 +65,30 @@ class SyntacticFunctionScope:
                            unshadowable function declaration in this scope.
         """
         func_name = declaration.get_name()
-        assert func_name not in self.__decls.keys()
+        assert func_name not in self.__decls
         if self.has_unshadowable_signature(func_name):
             raise ValueError("Function " + func_name + " cannot be redefined or shadowed")
         self.__decls[func_name] = declaration
+        SyntacticFunctionScope.__invalidate_lookup_caches()
+
+    def add_declarations(self, func_names, signature: ast.FunctionSignature):
+        """
+        Adds declarations of functions sharing the same signature to the scope.
+
+        :param func_names: The functions' names. No same-named signature must have previously been added to the
+                           scope.
+        :param signature: The functions' signature.
+        :return: None
+        :raises ValueError if adding any of the functions is prevented by the existence of a same-named,
+                           unshadowable function declaration in this scope.
+        """
+        declarations = {func_name: ast.FunctionDeclaration(func_name, signature) for func_name in func_names}
+        for func_name in declarations:
+            assert func_name not in self.__decls
+            if self.has_unshadowable_signature(func_name):
+                raise ValueError("Function " + func_name + " cannot be redefined or shadowed")
+        self.__decls.update(declarations)
+        SyntacticFunctionScope.__invalidate_lookup_caches()
 
     def has_unshadowable_signature(self, func_name):
         """
@@ -71,6 +111,7 @@ class SyntacticFunctionScope:
         :return: None
         """
         self.__parent = new_parent
+        SyntacticFunctionScope.__invalidate_lookup_caches()
 
     def get_parent(self):
         """
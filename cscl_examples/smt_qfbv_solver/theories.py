@@ -3,6 +3,14 @@ import cscl_examples.smt_qfbv_solver.sorts as sorts
 import cscl_examples.smt_qfbv_solver.syntactic_scope as synscope
 import cscl_examples.smt_qfbv_solver.ast as ast
 
+# Mangled names of the parametrized functions:
+_EXTRACT_FN_NAME = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("extract")
+_REPEAT_FN_NAME = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("repeat")
+_ZERO_EXTEND_FN_NAME = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("zero_extend")
+_SIGN_EXTEND_FN_NAME = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("sign_extend")
+_ROTATE_LEFT_FN_NAME = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("rotate_left")
+_ROTATE_RIGHT_FN_NAME = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("rotate_right")
+
 
 class TheorySyntacticFunctionScopeFactory(abc.ABC):
     """
@@ -37,8 +45,7 @@ class CoreSyntacticFunctionScopeFactory(TheorySyntacticFunctionScopeFactory):
 
         comp_signature = ast.FunctionSignature(__comp_sig_fn, 2, False)
 
-        target.add_declaration(ast.FunctionDeclaration("=", comp_signature))
-        target.add_declaration(ast.FunctionDeclaration("distinct", comp_signature))
+        target.add_declarations(("=", "distinct"), comp_signature)
 
     @staticmethod
     def __add_ite_fn(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
@@ -51,7 +58,7 @@ class CoreSyntacticFunctionScopeFactory(TheorySyntacticFunctionScopeFactory):
     @staticmethod
     def __add_not_fn(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __not_sig_fn(x):
-            if len(x) == 1 and isinstance(x[0], sorts.BooleanSort):
+            if len(x) == 1 and type(x[0]) is sorts.BooleanSort:
                 return sort_ctx.get_bool_sort()
             return None
 
@@ -60,16 +67,13 @@ class CoreSyntacticFunctionScopeFactory(TheorySyntacticFunctionScopeFactory):
     @staticmethod
     def __add_binary_fns(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __binary_bool_sig_fn(x):
-            if len(x) == 2 and isinstance(x[0], sorts.BooleanSort) and (x[0] is x[1]):
+            if len(x) == 2 and type(x[0]) is sorts.BooleanSort and (x[0] is x[1]):
                 return sort_ctx.get_bool_sort()
             return None
 
         binary_bool_signature = ast.FunctionSignature(__binary_bool_sig_fn, 2, False)
 
-        target.add_declaration(ast.FunctionDeclaration("=>", binary_bool_signature))
-        target.add_declaration(ast.FunctionDeclaration("and", binary_bool_signature))
-        target.add_declaration(ast.FunctionDeclaration("or", binary_bool_signature))
-        target.add_declaration(ast.FunctionDeclaration("xor", binary_bool_signature))
+        target.add_declarations(("=>", "and", "or", "xor"), binary_bool_signature)
 
     @staticmethod
     def __add_constants(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
@@ -101,7 +105,7 @@ class FixedSizeBVSyntacticFunctionScopeFactory(TheorySyntacticFunctionScopeFacto
     @staticmethod
     def __add_concat_fn(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __concat_sig_fn(x):
-            if len(x) == 2 and all(isinstance(z, sorts.BitvectorSort) for z in x):
+            if len(x) == 2 and type(x[0]) is sorts.BitvectorSort and type(x[1]) is sorts.BitvectorSort:
                 return sort_ctx.get_bv_sort(x[0].get_len() + x[1].get_len())
         target.add_declaration(ast.FunctionDeclaration("concat",
                                                        ast.FunctionSignature(__concat_sig_fn, 2, False)))
@@ -110,37 +114,36 @@ class FixedSizeBVSyntacticFunctionScopeFactory(TheorySyntacticFunctionScopeFacto
     def __add_extract_fn(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __extract_sig_fn(x):
             if len(x) == 3 and isinstance(x[0], int) and isinstance(x[1], int)\
-                    and isinstance(x[2], sorts.BitvectorSort):
+                    and type(x[2]) is sorts.BitvectorSort:
                 i, j = x[0:2]
                 if (x[2].get_len() > i) and (i >= j) and (j >= 0):
                     return sort_ctx.get_bv_sort(i - j + 1)
-        decl = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("extract")
         sig = ast.FunctionSignature(__extract_sig_fn, 1, False, 2)
-        target.add_declaration(ast.FunctionDeclaration(decl, sig))
+        target.add_declaration(ast.FunctionDeclaration(_EXTRACT_FN_NAME, sig))
 
     @staticmethod
     def __add_bv_neg_fns(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __neg_sig_fn(x):
-            if len(x) == 1 and isinstance(x[0], sorts.BitvectorSort):
+            if len(x) == 1 and type(x[0]) is sorts.BitvectorSort:
                 return sort_ctx.get_bv_sort(x[0].get_len())
         neg_sig = ast.FunctionSignature(__neg_sig_fn, 1, False)
-        target.add_declaration(ast.FunctionDeclaration("bvneg", neg_sig))
-        target.add_declaration(ast.FunctionDeclaration("bvnot", neg_sig))
+        target.add_declarations(("bvneg", "bvnot"), neg_sig)
 
     @staticmethod
     def __add_bv_binary_fns(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __binary_sig_fn(x):
-            if len(x) == 2 and all(isinstance(z, sorts.BitvectorSort) for z in x) and x[0].get_len() == x[1].get_len():
+            if len(x) == 2 and type(x[0]) is sorts.BitvectorSort and type(x[1]) is sorts.BitvectorSort\
+                    and x[0].get_len() == x[1].get_len():
                 return sort_ctx.get_bv_sort(x[0].get_len())
         binary_sig = ast.FunctionSignature(__binary_sig_fn, 2, False)
 
-        for name in ("bvand", "bvor", "bvadd", "bvmul", "bvudiv", "bvurem", "bvshl", "bvlshr"):
-            target.add_declaration(ast.FunctionDeclaration(name, binary_sig))
+        target.add_declarations(("bvand", "bvor", "bvadd", "bvmul", "bvudiv", "bvurem", "bvshl", "bvlshr"), binary_sig)
 
     @staticmethod
     def __add_comparison_fns(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __comp_sig_fn(x):
-            if len(x) == 2 and all(isinstance(z, sorts.BitvectorSort) for z in x) and x[0].get_len() == x[1].get_len():
+            if len(x) == 2 and type(x[0]) is sorts.BitvectorSort and type(x[1]) is sorts.BitvectorSort\
+                    and x[0].get_len() == x[1].get_len():
                 return sort_ctx.get_bool_sort()
 
         target.add_declaration(ast.FunctionDeclaration("bvult",
@@ -173,54 +176,48 @@ class QFBVExtSyntacticFunctionScopeFactory(TheorySyntacticFunctionScopeFactory):
     @staticmethod
     def __add_bv_binary_fns(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __binary_sig_fn(x):
-            if len(x) == 2 and all(isinstance(z, sorts.BitvectorSort) for z in x) and x[0].get_len() == x[1].get_len():
+            if len(x) == 2 and type(x[0]) is sorts.BitvectorSort and type(x[1]) is sorts.BitvectorSort\
+                    and x[0].get_len() == x[1].get_len():
                 return sort_ctx.get_bv_sort(x[0].get_len())
 
         binary_sig = ast.FunctionSignature(__binary_sig_fn, 2, False)
 
-        for name in ("bvnand", "bvnor", "bvxor", "bvxnor", "bvcomp", "bvsub", "bvsdiv", "bvsrem", "bvsmod", "bvashr"):
-            target.add_declaration(ast.FunctionDeclaration(name, binary_sig))
+        target.add_declarations(("bvnand", "bvnor", "bvxor", "bvxnor", "bvcomp",
+                                 "bvsub", "bvsdiv", "bvsrem", "bvsmod", "bvashr"), binary_sig)
 
     @staticmethod
     def __add_comparison_fns(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __comp_sig_fn(x):
-            if len(x) == 2 and all(isinstance(z, sorts.BitvectorSort) for z in x) and x[0].get_len() == x[1].get_len():
+            if len(x) == 2 and type(x[0]) is sorts.BitvectorSort and type(x[1]) is sorts.BitvectorSort\
+                    and x[0].get_len() == x[1].get_len():
                 return sort_ctx.get_bool_sort()
         comp_sig = ast.FunctionSignature(__comp_sig_fn, 2, False)
 
-        for name in ("bvule", "bvugt", "bvuge", "bvslt", "bvsle", "bvsgt", "bvsge"):
-            target.add_declaration(ast.FunctionDeclaration(name, comp_sig))
+        target.add_declarations(("bvule", "bvugt", "bvuge", "bvslt", "bvsle", "bvsgt", "bvsge"), comp_sig)
 
     @staticmethod
     def __add_repeat_fn(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __repeat_sig_fn(x):
-            if len(x) == 2 and isinstance(x[0], int) and isinstance(x[1], sorts.BitvectorSort):
+            if len(x) == 2 and isinstance(x[0], int) and type(x[1]) is sorts.BitvectorSort:
                 return sort_ctx.get_bv_sort(x[0] * x[1].get_len())
-        fname = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("repeat")
-        target.add_declaration(ast.FunctionDeclaration(fname,
+        target.add_declaration(ast.FunctionDeclaration(_REPEAT_FN_NAME,
                                                        ast.FunctionSignature(__repeat_sig_fn, 1, False, 1)))
 
     @staticmethod
     def __add_extend_fns(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __extend_sig_fn(x):
-            if len(x) == 2 and isinstance(x[0], int) and isinstance(x[1], sorts.BitvectorSort):
+            if len(x) == 2 and isinstance(x[0], int) and type(x[1]) is sorts.BitvectorSort:
                 return sort_ctx.get_bv_sort(x[0] + x[1].get_len())
         extend_sig = ast.FunctionSignature(__extend_sig_fn, 1, False, 1)
-        zero_extend_name = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("zero_extend")
-        sign_extend_name = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("sign_extend")
-        target.add_declaration(ast.FunctionDeclaration(zero_extend_name, extend_sig))
-        target.add_declaration(ast.FunctionDeclaration(sign_extend_name, extend_sig))
+        target.add_declarations((_ZERO_EXTEND_FN_NAME, _SIGN_EXTEND_FN_NAME), extend_sig)
 
     @staticmethod
     def __add_rotate_fns(target: synscope.SyntacticFunctionScope, sort_ctx: sorts.SortContext):
         def __rotate_sig_fn(x):
-            if len(x) == 2 and isinstance(x[0], int) and isinstance(x[1], sorts.BitvectorSort):
+            if len(x) == 2 and isinstance(x[0], int) and type(x[1]) is sorts.BitvectorSort:
                 return sort_ctx.get_bv_sort(x[1].get_len())
         rotate_sig = ast.FunctionSignature(__rotate_sig_fn, 1, False, 1)
-        rl_name = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("rotate_left")
-        rr_name = synscope.SyntacticFunctionScope.mangle_parametrized_function_name("rotate_right")
-        target.add_declaration(ast.FunctionDeclaration(rl_name, rotate_sig))
-        target.add_declaration(ast.FunctionDeclaration(rr_name, rotate_sig))
+        target.add_declarations((_ROTATE_LEFT_FN_NAME, _ROTATE_RIGHT_FN_NAME), rotate_sig)
 
     def create_syntactic_scope(self,
                                sort_ctx: sorts.SortContext) -> synscope.SyntacticFunctionScope:
@@ -3,7 +3,7 @@ Rough performance tests for PyCSCL, measuring the produced amount of clauses per
 """
 
 from cscl.bitvector_gate_encoders import encode_bv_parallel_mul_gate
-from cscl.cardinality_constraint_encoders import encode_at_most_k_constraint_ltseq
+from cscl.cardinality_constraint_encoders import iter_at_most_k_constraint_ltseq
 import cscl.interfaces as interfaces
 import timeit
 
@@ -18,6 +18,11 @@ class PerfTestClauseConsumer(interfaces.CNFLiteralFactory, interfaces.ClauseCons
         self._nextVar += 1
         return self._nextVar
 
+    def create_literals(self, n):
+        first_var = self._nextVar + 1
+        self._nextVar += n
+        return list(range(first_var, self._nextVar + 1))
+
     def consume_clause(self, clause):
         self._numClauses += 1
         self._numLits += len(clause)
@@ -38,7 +43,7 @@ def perftest_bv_mul(sink):
 
 def perftest_card_ltseq(sink):
     for i in range(1, 2000):
-        for c in encode_at_most_k_constraint_ltseq(sink, 10, range(i, i+64)):
+        for c in iter_at_most_k_constraint_ltseq(sink, 10, range(i, i+64)):
             sink.consume_clause(c)
 
 
@@ -688,6 +688,75 @@ class TestEncodeBVSignedLessThanOrEqualCompGate(unittest.TestCase,
         return generate_truth_table_for_bv_predicate(gate_arity, predicate)
 
 
+class TestEncodeBVUnsignedAndSignedLessThanOrEqualCompGates(unittest.TestCase,
+                                                            AbstractTruthTableBasedBitvectorGateTest):
+    """
+    Test for bvg.encode_bv_ule_and_sle_gates
+    """
+
+    def get_bitvector_gate_encoder_under_test(self):
+        return bvg.encode_bv_ule_and_sle_gates
+
+    def is_encoder_under_test_bv_predicate(self):
+        return True
+
+    def encode_gate_under_test(self, clause_consumer: cscl_if.ClauseConsumer,
+                               lit_factory: cscl_if.CNFLiteralFactory, gate_arity: int):
+        lhs_input_lits = [lit_factory.create_literal() for _ in range(0, gate_arity)]
+        rhs_input_lits = [lit_factory.create_literal() for _ in range(0, gate_arity)]
+
+        encoder_under_test = self.get_bitvector_gate_encoder_under_test()
+        ule_output_lit, sle_output_lit = encoder_under_test(clause_consumer=clause_consumer,
+                                                            lit_factory=lit_factory,
+                                                            lhs_input_lits=lhs_input_lits,
+                                                            rhs_input_lits=rhs_input_lits)
+
+        return lhs_input_lits+rhs_input_lits, [ule_output_lit, sle_output_lit]
+
+    def generate_truth_table(self, gate_arity: int):
+        def __to_signed(x: int):
+            return x - 2**gate_arity if x >= 2**(gate_arity-1) else x
+
+        truth_table = []
+        for lhs, rhs in itertools.product(range(0, 2 ** gate_arity), range(0, 2 ** gate_arity)):
+            ule = 1 if lhs <= rhs else 0
+            sle = 1 if __to_signed(lhs) <= __to_signed(rhs) else 0
+            table_entry = (int_to_bitvec(lhs, gate_arity) + int_to_bitvec(rhs, gate_arity), (ule, sle))
+            truth_table.append(table_entry)
+        return truth_table
+
+    def test_uses_and_returns_provided_output_literals(self):
+        lit_factory = TestLiteralFactory()
+        clause_consumer = CollectingClauseConsumer()
+
+        lhs_input_lits = [lit_factory.create_literal() for _ in range(0, 3)]
+        rhs_input_lits = [lit_factory.create_literal() for _ in range(0, 3)]
+        ule_output_lit = lit_factory.create_literal()
+        sle_output_lit = lit_factory.create_literal()
+
+        result = bvg.encode_bv_ule_and_sle_gates(clause_consumer=clause_consumer,
+                                                 lit_factory=lit_factory,
+                                                 lhs_input_lits=lhs_input_lits,
+                                                 rhs_input_lits=rhs_input_lits,
+                                                 ule_output_lit=ule_output_lit,
+                                                 sle_output_lit=sle_output_lit)
+        self.assertEqual(result, (ule_output_lit, sle_output_lit))
+
+    def test_creates_output_literals_if_none_provided(self):
+        lit_factory = TestLiteralFactory()
+        clause_consumer = CollectingClauseConsumer()
+
+        lhs_input_lits = [lit_factory.create_literal() for _ in range(0, 3)]
+        rhs_input_lits = [lit_factory.create_literal() for _ in range(0, 3)]
+        all_inputs = lhs_input_lits + rhs_input_lits
+
+        result = bvg.encode_bv_ule_and_sle_gates(clause_consumer, lit_factory, lhs_input_lits, rhs_input_lits)
+        self.assertEqual(len(result), 2)
+        self.assertNotEqual(abs(result[0]), abs(result[1]))
+        self.assertFalse(any(x in all_inputs for x in result))
+        self.assertFalse(any(-x in all_inputs for x in result))
+
+
 class TestEncodeBVEqualityCompGate(unittest.TestCase,
                                    AbstractTruthTableBasedPlainBitvectorPredicateGateTest):
     """
@@ -731,7 +800,7 @@ class TestEncodeParallelBVMultiplierGateEncoder(AbstractTruthTableBasedBitvector
 
                 input_setting = int_to_bitvec(lhs_setting, gate_arity) + int_to_bitvec(rhs_setting, gate_arity)
                 output_setting = int_to_bitvec(expected_output, gate_arity) + \
-                    (expected_overflow,) if include_overflow_bit else tuple()
+                    ((expected_overflow,) if include_overflow_bit else tuple())
                 result.append((input_setting, output_setting))
         return result
 
@@ -766,6 +835,55 @@ class TestEncodeParallelBVMultiplierGateEncoderWithoutOverflowLit(unittest.TestC
         return False
 
 
+class TestEncodeParallelBVMultiplierGateEncoderForSquaring(TestEncodeParallelBVMultiplierGateEncoder, abc.ABC):
+    """
+    Test for bvg.encode_bv_parallel_mul_gate, multiplying a bitvector with itself
+    """
+
+    def generate_truth_table(self, gate_arity: int):
+        result = []
+        include_overflow_bit = self.is_test_with_overflow_output()
+
+        for setting in range(0, 2 ** gate_arity):
+            expected_output = setting * setting
+            expected_overflow = 1 if ((expected_output >> gate_arity) != 0) else 0
+            expected_output = expected_output & ((1 << gate_arity) - 1)
+
+            output_setting = int_to_bitvec(expected_output, gate_arity) + \
+                ((expected_overflow,) if include_overflow_bit else tuple())
+            result.append((int_to_bitvec(setting, gate_arity), output_setting))
+        return result
+
+    def encode_gate_under_test(self, clause_consumer: cscl_if.ClauseConsumer,
+                               lit_factory: cscl_if.CNFLiteralFactory, gate_arity: int):
+        input_lits = [lit_factory.create_literal() for _ in range(0, gate_arity)]
+        overflow_lit = lit_factory.create_literal() if self.is_test_with_overflow_output() else None
+
+        encoder_under_test = self.get_bitvector_gate_encoder_under_test()
+        output_lits = encoder_under_test(clause_consumer=clause_consumer,
+                                         lit_factory=lit_factory,
+                                         lhs_input_lits=input_lits,
+                                         rhs_input_lits=input_lits,
+                                         overflow_lit=overflow_lit)
+
+        if overflow_lit is None:
+            return input_lits, output_lits
+        else:
+            return input_lits, (output_lits + [overflow_lit])
+
+
+class TestEncodeParallelBVMultiplierGateEncoderForSquaringWithOverflowLit(
+        unittest.TestCase, TestEncodeParallelBVMultiplierGateEncoderForSquaring):
+    def is_test_with_overflow_output(self) -> bool:
+        return True
+
+
+class TestEncodeParallelBVMultiplierGateEncoderForSquaringWithoutOverflowLit(
+        unittest.TestCase, TestEncodeParallelBVMultiplierGateEncoderForSquaring):
+    def is_test_with_overflow_output(self) -> bool:
+        return False
+
+
 #
 # Tests for bitvector MUX:
 #
@@ -202,6 +202,9 @@ class AbstractEncodeAtMostKConstraintTestCase(abc.ABC):
     def test_constraining_5lits(self):
         self.__at_most_k_constraint_encoder_test(self.get_encoder_fn(), 5)
 
+    def test_constraining_6lits(self):
+        self.__at_most_k_constraint_encoder_test(self.get_encoder_fn(), 6)
+
 
 class TestEncodeAtMostKConstraintBinomial(unittest.TestCase, AbstractEncodeAtMostKConstraintTestCase):
     def get_encoder_fn(self):
@@ -213,11 +216,69 @@ class TestEncodeAtMostKConstraintLTSeq(unittest.TestCase, AbstractEncodeAtMostKC
         return encode_at_most_k_constraint_ltseq
 
 
+class TestIterAtMostKConstraintBinomial(unittest.TestCase, AbstractEncodeAtMostKConstraintTestCase):
+    def get_encoder_fn(self):
+        return lambda lit_factory, k, lits: list(iter_at_most_k_constraint_binomial(lit_factory, k, lits))
+
+
+class TestIterAtMostKConstraintLTSeq(unittest.TestCase, AbstractEncodeAtMostKConstraintTestCase):
+    def get_encoder_fn(self):
+        return lambda lit_factory, k, lits: list(iter_at_most_k_constraint_ltseq(lit_factory, k, lits))
+
+
 class TestEncodeAtMostKConstraintCommander(unittest.TestCase, AbstractEncodeAtMostKConstraintTestCase):
     def get_encoder_fn(self):
         return encode_at_most_k_constraint_commander
 
 
+class TestIterAtMostKConstraintCommander(unittest.TestCase, AbstractEncodeAtMostKConstraintTestCase):
+    def get_encoder_fn(self):
+        return lambda lit_factory, k, lits: list(iter_at_most_k_constraint_commander(lit_factory, k, lits))
+
+
+class TestEncodeAtLeastKConstraint(unittest.TestCase):
+    def __at_least_k_constraint_encoder_test(self, at_most_k_encoder, amnt_constrained_lits):
+        for k in range(0, amnt_constrained_lits + 1):
+            checker = TrivialSATSolver()
+            constrained_lits = [checker.create_literal() for _ in range(0, amnt_constrained_lits)]
+            for clause in encode_at_least_k_constraint(checker, k, constrained_lits, at_most_k_encoder):
+                checker.consume_clause(clause)
+
+            for amnt_true_lits in range(0, amnt_constrained_lits + 1):
+                for true_lits in subsets_of_size_k_trivial(constrained_lits, amnt_true_lits):
+                    assumptions = [x if x in true_lits else -x for x in constrained_lits]
+                    self.assertEqual(checker.solve(assumptions), amnt_true_lits >= k,
+                                     "Failed for k=" + str(k) + ", assumptions=" + str(assumptions))
+
+    def test_constraining_4lits_with_binomial_encoder(self):
+        self.__at_least_k_constraint_encoder_test(encode_at_most_k_constraint_binomial, 4)
+
+    def test_constraining_4lits_with_ltseq_encoder(self):
+        self.__at_least_k_constraint_encoder_test(encode_at_most_k_constraint_ltseq, 4)
+
+
+class TestEncodeAtMostOneConstraintBinary(unittest.TestCase):
+    def test_constraining_empty_set_of_lits_yields_empty_problem(self):
+        result = encode_at_most_one_constraint_binary(TrivialSATSolver(), [])
+        self.assertEqual(result, [], "Bad encoding: " + str(result))
+
+    def test_constraining_single_lit_yields_empty_problem(self):
+        result = encode_at_most_one_constraint_binary(TrivialSATSolver(), [1])
+        self.assertEqual(result, [], "Bad encoding: " + str(result))
+
+    def test_constraining_up_to_6lits(self):
+        for amnt_constrained_lits in range(2, 7):
+            checker = TrivialSATSolver()
+            constrained_lits = [checker.create_literal() for _ in range(0, amnt_constrained_lits)]
+            for clause in encode_at_most_one_constraint_binary(checker, constrained_lits):
+                checker.consume_clause(clause)
+
+            for amnt_true_lits in range(0, amnt_constrained_lits + 1):
+                for assumptions in subsets_of_size_k_trivial(constrained_lits, amnt_true_lits):
+                    self.assertEqual(checker.solve(assumptions), amnt_true_lits <= 1,
+                                     "Failed for assumptions=" + str(assumptions))
+
+
 class TestChunks(unittest.TestCase):
     def test_raises_for_negative_chunk_size(self):
         with self.assertRaises(ValueError):
@@ -13,6 +13,13 @@ class TestDIMACSPrinter(TestCase):
                          + str(expected_output) + " vs. actual output: "
                          + str(actual_output))
 
+    def test_creates_consecutive_literals(self):
+        under_test = DIMACSPrinter()
+        var1 = under_test.create_literal()
+        self.assertEqual(under_test.create_literals(3), [var1+1, var1+2, var1+3])
+        self.assertEqual(under_test.create_literals(0), [])
+        self.assertEqual(under_test.create_literal(), var1+4)
+
     def test_prints_empty(self):
         under_test = DIMACSPrinter()
         self.__dimacs_printer_conversion_test(under_test, [], ["p cnf 0 0"])
@@ -36,3 +43,14 @@ class TestDIMACSPrinter(TestCase):
         clauses = [[var1, var2, -var3], [-var2], [var1, var3]]
         expected_output = ["p cnf 3 3", "1 2 -3 0", "-2 0", "1 3 0"]
         self.__dimacs_printer_conversion_test(under_test, clauses, expected_output)
+
+    def test_prints_multiple_clauses_in_bulk(self):
+        under_test = DIMACSPrinter()
+        var1 = under_test.create_literal()
+        var2 = under_test.create_literal()
+        under_test.consume_clause([var1, -var2])
+        under_test.consume_clause([])
+
+        actual_output = []
+        under_test.print_bulk(lambda x: actual_output.append(x))
+        self.assertEqual(actual_output, ["p cnf 2 2\n1 -2 0\n 0\n"])
@@ -0,0 +1,76 @@
+import unittest
+import cscl_examples.smt_qfbv_solver.ast as ast
+import cscl_examples.smt_qfbv_solver.sorts as sorts
+
+
+class TestFunctionSignature(unittest.TestCase):
+    def test_range_sorts_are_computed_once_per_domain(self):
+        sort_ctx = sorts.SortContext()
+        queries = []
+
+        def __sig_fn(domain_sorts):
+            queries.append(domain_sorts)
+            return sort_ctx.get_bool_sort() if domain_sorts[0] is sort_ctx.get_int_sort() else None
+
+        under_test = ast.FunctionSignature(__sig_fn, 1, True)
+        for _ in range(0, 2):
+            self.assertIs(under_test.get_range_sort([sort_ctx.get_int_sort()]), sort_ctx.get_bool_sort())
+            self.assertIsNone(under_test.get_range_sort([sort_ctx.get_bv_sort(2)]))
+        self.assertEqual(len(queries), 2)
+
+
+class TestLetTermASTNode(unittest.TestCase):
+    def test_child_nodes_reflect_replaced_defining_term(self):
+        sort_ctx = sorts.SortContext()
+        def_term = ast.LiteralASTNode(1, sort_ctx.get_int_sort())
+        enclosed_term = ast.LiteralASTNode(2, sort_ctx.get_int_sort())
+        under_test = ast.LetTermASTNode([("x", def_term)], enclosed_term)
+        self.assertEqual(tuple(under_test.get_child_nodes()), (def_term, enclosed_term))
+
+        new_def_term = ast.LiteralASTNode(3, sort_ctx.get_int_sort())
+        under_test.set_child_node(0, new_def_term)
+        self.assertEqual(tuple(under_test.get_child_nodes()), (new_def_term, enclosed_term))
+        self.assertEqual(under_test.get_let_symbols_and_defining_terms()[0], ("x", new_def_term))
+
+    def test_child_nodes_reflect_replaced_enclosed_term(self):
+        sort_ctx = sorts.SortContext()
+        def_term = ast.LiteralASTNode(1, sort_ctx.get_int_sort())
+        enclosed_term = ast.LiteralASTNode(2, sort_ctx.get_int_sort())
+        under_test = ast.LetTermASTNode([("x", def_term)], enclosed_term)
+        self.assertEqual(tuple(under_test.get_child_nodes()), (def_term, enclosed_term))
+
+        new_enclosed_term = ast.LiteralASTNode(3, sort_ctx.get_int_sort())
+        under_test.set_child_node(1, new_enclosed_term)
+        self.assertEqual(tuple(under_test.get_child_nodes()), (def_term, new_enclosed_term))
+
+        newer_enclosed_term = ast.LiteralASTNode(4, sort_ctx.get_int_sort())
+        under_test.set_enclosed_term(newer_enclosed_term)
+        self.assertEqual(tuple(under_test.get_child_nodes()), (def_term, newer_enclosed_term))
+        self.assertIs(under_test.get_enclosed_term(), newer_enclosed_term)
+
+    def test_sort_reflects_replaced_enclosed_term(self):
+        sort_ctx = sorts.SortContext()
+        def_term = ast.LiteralASTNode(1, sort_ctx.get_int_sort())
+        under_test = ast.LetTermASTNode([("x", def_term)], ast.LiteralASTNode(2, sort_ctx.get_int_sort()))
+        self.assertIs(under_test.get_sort(), sort_ctx.get_int_sort())
+
+        under_test.set_child_node(1, ast.LiteralASTNode(3, sort_ctx.get_bv_sort(4)))
+        self.assertIs(under_test.get_sort(), sort_ctx.get_bv_sort(4))
+
+        under_test.set_enclosed_term(ast.LiteralASTNode(4, sort_ctx.get_bool_sort()))
+        self.assertIs(under_test.get_sort(), sort_ctx.get_bool_sort())
+
+
+class TestDefineFunCommandASTNode(unittest.TestCase):
+    def test_child_nodes_reflect_replaced_defining_term(self):
+        sort_ctx = sorts.SortContext()
+        def_term = ast.LiteralASTNode(1, sort_ctx.get_int_sort())
+        under_test = ast.DefineFunCommandASTNode("x", [], sort_ctx.get_int_sort(), def_term)
+        self.assertEqual(tuple(under_test.get_child_nodes()), (def_term,))
+
+        new_def_term = ast.LiteralASTNode(2, sort_ctx.get_int_sort())
+        under_test.set_child_node(0, new_def_term)
+        self.assertEqual(tuple(under_test.get_child_nodes()), (new_def_term,))
+
+        with self.assertRaises(ValueError):
+            under_test.set_child_node(1, def_term)
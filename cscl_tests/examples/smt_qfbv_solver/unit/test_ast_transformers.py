@@ -177,3 +177,29 @@ class TestFunctionDefinitionInliner(unittest.TestCase):
                     FunctionApplicationASTNode Function: y Sort: Int"""
 
         self.__expect_ast(expected_ast, 12, under_test.transform(test_data))
+
+    def test_inlines_constants_in_deeply_nested_terms(self):
+        under_test = ast_trans.FunctionDefinitionInliner()
+        sort_ctx = sorts.SortContext()
+
+        define_int_const_node = ast.DefineFunCommandASTNode("x", [], sort_ctx.get_int_sort(),
+                                                            ast.LiteralASTNode(100, sort_ctx.get_int_sort()))
+        x_decl = ast.FunctionDeclaration("x",
+                                         ast.FunctionSignature(lambda x: sort_ctx.get_int_sort(), 0, True),
+                                         define_int_const_node)
+        neg_decl = ast.FunctionDeclaration("-", ast.FunctionSignature(lambda x: sort_ctx.get_int_sort(), 1, True))
+
+        nesting_depth = 5000
+        term = ast.FunctionApplicationASTNode(x_decl, [])
+        for _ in range(0, nesting_depth):
+            term = ast.FunctionApplicationASTNode(neg_decl, [term])
+        assert_node = ast.AssertCommandASTNode(term)
+
+        result = under_test.transform([define_int_const_node, assert_node])
+        self.assertEqual(result, [assert_node])
+
+        innermost_term = assert_node.get_child_nodes()[0]
+        for _ in range(0, nesting_depth):
+            innermost_term = innermost_term.get_child_nodes()[0]
+        self.assertTrue(isinstance(innermost_term, ast.LiteralASTNode))
+        self.assertEqual(innermost_term.get_literal(), 100)
@@ -33,6 +33,10 @@ class TestParseSmtlib2Literal(unittest.TestCase):
         with self.assertRaises(ValueError):
             smt.parse_smtlib2_literal("001", sort_ctx)
 
+    def test_non_ascii_digits_are_not_literal(self):
+        sort_ctx = sorts.SortContext()
+        self.assertIsNone(smt.parse_smtlib2_literal("\u0661", sort_ctx))
+
     def test_parses_bv0(self):
         sort_ctx = sorts.SortContext()
         result = smt.parse_smtlib2_literal("#b0", sort_ctx)
@@ -63,6 +67,16 @@ class TestParseSmtlib2Literal(unittest.TestCase):
         # noinspection PyUnresolvedReferences
         self.assertEqual(sort.get_len(), 5)
 
+    def test_fails_for_bv_without_digits(self):
+        sort_ctx = sorts.SortContext()
+        with self.assertRaises(ValueError):
+            smt.parse_smtlib2_literal("#b", sort_ctx)
+
+    def test_fails_for_bv_with_non_binary_digits(self):
+        sort_ctx = sorts.SortContext()
+        with self.assertRaises(ValueError):
+            smt.parse_smtlib2_literal("#b1021", sort_ctx)
+
 
 class TestParseSmtlib2Sort(unittest.TestCase):
     def test_parses_int_sort(self):
@@ -91,6 +105,11 @@ class TestParseSmtlib2Sort(unittest.TestCase):
         with self.assertRaises(ValueError):
             smt.parse_smtlib2_sort(["_", "BitVec", "-1"], sort_ctx)
 
+    def test_refuses_bv_sort_with_non_ascii_digits(self):
+        sort_ctx = sorts.SortContext()
+        with self.assertRaises(ValueError):
+            smt.parse_smtlib2_sort(["_", "BitVec", "\u0661"], sort_ctx)
+
     def test_refuses_unknown_sort(self):
         sort_ctx = sorts.SortContext()
         with self.assertRaises(ValueError):
@@ -109,6 +128,11 @@ class TestParseSmtlib2Symbol(unittest.TestCase):
         with self.assertRaises(ValueError):
             smt.parse_smtlib2_symbol("Foo Bar")
 
+    def test_string_with_trailing_illegal_char_is_not_symbol(self):
+        for x in ("Foo(", "Foo|", "Foo\"", "Foo#bar"):
+            with self.assertRaises(ValueError):
+                smt.parse_smtlib2_symbol(x)
+
     def test_string_with_leading_digit_is_not_symbol(self):
         with self.assertRaises(ValueError):
             smt.parse_smtlib2_symbol("3x")
@@ -256,6 +280,29 @@ class TestParseSmtlib2Term(unittest.TestCase):
         self.assertEqual(actual_tree, expected_tree,
                          "Unexpected AST:\n" + actual_tree + "\nExpected:\n" + expected_tree)
 
+    def test_parse_deeply_nested_term(self):
+        sort_ctx = sorts.SortContext()
+        fun_scope = smt.SyntacticFunctionScope(None)
+        intthingy_signature_fn = create_function_signature_fn(domain_sorts=[sort_ctx.get_int_sort()],
+                                                              range_sort=sort_ctx.get_int_sort())
+        fun_scope.add_declaration(ast.FunctionDeclaration("integerthingy",
+                                                          smt.FunctionSignature(intthingy_signature_fn, 1, True)))
+
+        depth = 5000
+        term_sexp = "1024"
+        for _ in range(0, depth):
+            term_sexp = ["integerthingy", term_sexp]
+
+        result = smt.parse_smtlib2_term(term_sexp, sort_ctx, fun_scope)
+        for _ in range(0, depth):
+            self.assertTrue(isinstance(result, ast.FunctionApplicationASTNode))
+            self.assertEqual(result.get_declaration().get_name(), "integerthingy")
+            result = result.get_child_nodes()[0]
+        self.assertTrue(isinstance(result, ast.LiteralASTNode))
+        # The following statement is OK due to the assertion that result is an instance of LiteralASTNode:
+        # noinspection PyUnresolvedReferences
+        self.assertEqual(result.get_literal(), 1024)
+
     def test_fails_for_function_application_with_bad_arity(self):
         sort_ctx = sorts.SortContext()
         fun_scope = smt.SyntacticFunctionScope(None)
@@ -390,6 +437,23 @@ class TestParseSmtlib2Term(unittest.TestCase):
         self.assertEqual(expected_tree, actual_tree,
                          "Unexpected AST:\n" + actual_tree + "\nExpected:\n" + expected_tree)
 
+    def test_parse_deeply_nested_let_term(self):
+        sort_ctx = sorts.SortContext()
+        fun_scope = smt.SyntacticFunctionScope(None)
+
+        depth = 5000
+        term_sexp = "x"
+        for _ in range(0, depth):
+            term_sexp = ["let", [["x", "x"]], term_sexp]
+        term_sexp = ["let", [["x", "#b101"]], term_sexp]
+
+        result = smt.parse_smtlib2_term(term_sexp, sort_ctx, fun_scope)
+        self.assertIs(result.get_sort(), sort_ctx.get_bv_sort(3))
+        for _ in range(0, depth+1):
+            self.assertTrue(isinstance(result, ast.LetTermASTNode))
+            result = result.get_enclosed_term()
+        self.assertTrue(isinstance(result, ast.FunctionApplicationASTNode))
+
     def test_fails_for_malformed_let_statement(self):
         sort_ctx = sorts.SortContext()
         fun_scope = smt.SyntacticFunctionScope(None)
@@ -482,6 +546,10 @@ class TestParseSmtlib2Term(unittest.TestCase):
         with self.assertRaises(ValueError):
             smt.parse_smtlib2_term(["_", "unsupported", "12"], sort_ctx, fun_scope)
 
+        # Non-symbol literal
+        with self.assertRaises(ValueError):
+            smt.parse_smtlib2_term(["_", ["bv1"], "12"], sort_ctx, fun_scope)
+
         # Malformed literal
         with self.assertRaises(ValueError):
             smt.parse_smtlib2_term(["_", "bv1Foo2", "12"], sort_ctx, fun_scope)
@@ -783,3 +851,19 @@ class TestParseSmtlib2Problem(unittest.TestCase):
             smt.parse_smtlib2_problem([["set-logic", "QF_BV"],
                                        ["push" "2"],
                                        ["pop", "3"]])
+
+
+class TestIterParseSmtlib2Problem(unittest.TestCase):
+    def test_parses_commands_lazily(self):
+        under_test = smt.iter_parse_smtlib2_problem([["declare-const", "foo", "Bool"],
+                                                     ["check-sat"],
+                                                     ["unsupported-cmd"]])
+        self.assertTrue(isinstance(next(under_test), ast.DeclareFunCommandASTNode))
+        self.assertTrue(isinstance(next(under_test), ast.CheckSATCommandASTNode))
+        with self.assertRaises(ValueError):
+            next(under_test)
+
+    def test_skips_ignored_commands(self):
+        result = list(smt.iter_parse_smtlib2_problem([["set-info", ":status", "sat"], ["check-sat"]]))
+        self.assertEqual(len(result), 1)
+        self.assertTrue(isinstance(result[0], ast.CheckSATCommandASTNode))
@@ -61,3 +61,53 @@ class TestSyntacticFunctionScope(unittest.TestCase):
         under_test = synscope.SyntacticFunctionScope(parent)
         with self.assertRaises(ValueError):
             under_test.add_declaration(decl)
+
+    def test_lookup_reflects_declaration_added_to_parent_after_lookup(self):
+        sort_ctx = sorts.SortContext()
+        sig = ast.FunctionSignature(lambda x: sort_ctx.get_int_sort() if len(x) == 0 else None, 0, True)
+        decl = ast.FunctionDeclaration("foo", sig)
+
+        parent = synscope.SyntacticFunctionScope(None)
+        under_test = synscope.SyntacticFunctionScope(parent)
+        self.assertIsNone(under_test.get_declaration("foo"))
+
+        parent.add_declaration(decl)
+        self.assertIs(under_test.get_declaration("foo"), decl)
+
+    def test_lookup_reflects_changed_parent_after_lookup(self):
+        sort_ctx = sorts.SortContext()
+        sig = ast.FunctionSignature(lambda x: sort_ctx.get_int_sort() if len(x) == 0 else None, 0, True)
+        decl = ast.FunctionDeclaration("foo", sig)
+
+        parent = synscope.SyntacticFunctionScope(None)
+        parent.add_declaration(decl)
+        under_test = synscope.SyntacticFunctionScope(synscope.SyntacticFunctionScope(parent))
+        self.assertIs(under_test.get_declaration("foo"), decl)
+
+        under_test.get_parent().set_parent(None)
+        self.assertIsNone(under_test.get_declaration("foo"))
+
+    def test_has_added_signatures(self):
+        sort_ctx = sorts.SortContext()
+        sig = ast.FunctionSignature(lambda x: sort_ctx.get_int_sort() if len(x) == 0 else None, 0, True)
+
+        under_test = synscope.SyntacticFunctionScope(None)
+        self.assertIsNone(under_test.get_declaration("bar"))
+        under_test.add_declarations(("foo", "bar"), sig)
+
+        for name in ("foo", "bar"):
+            lookup_result = under_test.get_declaration(name)
+            self.assertEqual(lookup_result.get_name(), name)
+            self.assertIs(lookup_result.get_signature(), sig)
+
+    def test_refuses_to_add_multiple_when_unshadowable(self):
+        sort_ctx = sorts.SortContext()
+        sig = ast.FunctionSignature(lambda x: sort_ctx.get_int_sort() if len(x) == 0 else None, 0, False)
+
+        parent = synscope.SyntacticFunctionScope(None)
+        parent.add_declaration(ast.FunctionDeclaration("foo", sig))
+
+        under_test = synscope.SyntacticFunctionScope(parent)
+        with self.assertRaises(ValueError):
+            under_test.add_declarations(("bar", "foo"), sig)
+        self.assertIsNone(under_test.get_declaration("bar"))